@@ -0,0 +1,41 @@
+"""Shared helpers for the ad-hoc Gemini test scripts.
+
+Keeps model probing to one network round-trip per unique model name across
+test_gemini_models.py and test_gemini_image_generation.py.
+"""
+
+import functools
+
+import google.generativeai as genai
+
+
+@functools.lru_cache(maxsize=16)
+def get_model(name: str) -> "genai.GenerativeModel":
+    """Reuse one client object per model name across scripts."""
+    return genai.GenerativeModel(name)
+
+
+@functools.lru_cache(maxsize=1)
+def available_model_names() -> frozenset:
+    """List models once per run; returns bare names without the models/ prefix."""
+    try:
+        return frozenset(m.name.rpartition("/")[2] for m in genai.list_models())
+    except Exception:
+        # If listing fails, don't block probing — treat everything as unknown
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=None)
+def probe_model(name: str) -> bool:
+    """Check a model with one tiny generation, at most once per name.
+
+    Models absent from list_models() are rejected without a network call.
+    """
+    available = available_model_names()
+    if available and name not in available:
+        return False
+    try:
+        response = get_model(name).generate_content("hello")
+        return bool(response and getattr(response, "text", None))
+    except Exception:
+        return False
@@ -2,13 +2,101 @@
 
 from typing import List, Dict, Any, Optional
 import json
-import re
 import google.generativeai as genai
 import streamlit as st
 
+# orjson parses JSON several times faster than the stdlib; fall back
+# silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.utils import get_api_key, validate_cartoon_data
 
 
+# Prompt skeleton built once at import; only topic/location/context get
+# substituted per call
+_GENERATION_PROMPT_TMPL = """
+You are a professional comedy writer in {location} creating cartoon concepts.
+
+Topic: {topic}{context_section}
+
+Your task:
+1. Create exactly 5 original, funny cartoon concepts about this topic
+2. Each concept must be:
+   - Clever and witty
+   - Specific to {location} or use local context
+   - Appropriate for a general audience
+   - Original (not recycling old jokes)
+
+3. Rank them from funniest (#1) to least funny (#5)
+4. Select the #1 concept as the winner
+
+For each concept provide:
+- title: Catchy cartoon title (spell correctly)
+- premise: One sentence describing the cartoon concept
+- why_funny: Brief explanation of the humor (max 15 words, spell correctly)
+- script: A 3-4 panel comic strip script with character dialogue. Format each panel as:
+  Panel 1: [Scene description]
+  Character Name: "[Dialogue]"
+  Panel 2: [Scene description]
+  Character Name: "[Dialogue]"
+  etc.
+
+Ensure all text is spelled correctly and grammatically sound.
+"""
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Extract the first balanced JSON object from free-form text.
+
+    Walks the text once tracking brace depth and string state (with
+    backslash escapes), so markdown fences or prose around the JSON are
+    skipped in a single O(n) pass with no regex backtracking.
+
+    Args:
+        text: Raw response text that may contain a JSON object
+
+    Returns:
+        The JSON object substring, or None if no balanced object is found
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            if depth > 0:
+                in_string = True
+        elif char == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == '}' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
+
+
 class CartoonGenerator:
     """Generates cartoon concepts from news topics."""
 
@@ -121,35 +209,11 @@ class CartoonGenerator:
         if news_context:
             context_section = f"\n\nNews context:\n{news_context}"
 
-        return f"""
-You are a professional comedy writer in {location} creating cartoon concepts.
-
-Topic: {topic}{context_section}
-
-Your task:
-1. Create exactly 5 original, funny cartoon concepts about this topic
-2. Each concept must be:
-   - Clever and witty
-   - Specific to {location} or use local context
-   - Appropriate for a general audience
-   - Original (not recycling old jokes)
-
-3. Rank them from funniest (#1) to least funny (#5)
-4. Select the #1 concept as the winner
-
-For each concept provide:
-- title: Catchy cartoon title (spell correctly)
-- premise: One sentence describing the cartoon concept
-- why_funny: Brief explanation of the humor (max 15 words, spell correctly)
-- script: A 3-4 panel comic strip script with character dialogue. Format each panel as:
-  Panel 1: [Scene description]
-  Character Name: "[Dialogue]"
-  Panel 2: [Scene description]
-  Character Name: "[Dialogue]"
-  etc.
-
-Ensure all text is spelled correctly and grammatically sound.
-"""
+        return _GENERATION_PROMPT_TMPL.format(
+            topic=topic,
+            location=location,
+            context_section=context_section
+        )
 
     def _parse_response(
         self,
@@ -159,24 +223,32 @@ Ensure all text is spelled correctly and grammatically sound.
     ) -> Dict[str, Any]:
         """Parse the API response into structured data.
 
-        With structured output enabled, response_text is guaranteed to be valid JSON.
+        With structured output enabled, response_text is normally valid JSON,
+        but responses occasionally arrive wrapped in markdown fences or prose.
         """
         try:
             # Structured output guarantees valid JSON, parse directly
-            data = json.loads(response_text)
-
-            # Ensure required fields exist
-            if 'topic' not in data:
-                data['topic'] = topic
-            if 'location' not in data:
-                data['location'] = location
-
-            return data
-
-        except json.JSONDecodeError as e:
-            st.error(f"JSON parsing error: {e}")
-            # If parsing fails, create fallback
-            return self._create_fallback_response(topic, location, f"Parse error: {e}")
+            data = _json_loads(response_text)
+        except ValueError as e:
+            # Recover by scanning for the first balanced JSON object
+            json_blob = _extract_json_object(response_text)
+            try:
+                data = _json_loads(json_blob) if json_blob else None
+            except ValueError:
+                data = None
+
+            if data is None:
+                st.error(f"JSON parsing error: {e}")
+                # If parsing fails, create fallback
+                return self._create_fallback_response(topic, location, f"Parse error: {e}")
+
+        # Ensure required fields exist
+        if 'topic' not in data:
+            data['topic'] = topic
+        if 'location' not in data:
+            data['location'] = location
+
+        return data
 
     def _fix_cartoon_data(
         self,
@@ -50,6 +50,23 @@ class ImageGenerator:
         else:
             self.text_model = None  # We'll use OpenRouter instead
 
+        # One Session per generator: successive script requests reuse the
+        # pooled keep-alive connection instead of paying a fresh TCP + TLS
+        # handshake per call. Static headers are set once here.
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.openrouter_api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/cartoon-of-the-day",
+            "X-Title": "Cartoon of the Day"
+        })
+
+    def __enter__(self) -> "ImageGenerator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.session.close()
+
     def script_comic_strip_openrouter(
         self,
         title: str,
@@ -110,13 +127,6 @@ Finally, provide the WINNING SCRIPT in detail with:
 
 Remember: The goal is OBVIOUS, LAUGH-OUT-LOUD humor that would make Gary Larson proud!"""
 
-        headers = {
-            "Authorization": f"Bearer {self.openrouter_api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/cartoon-of-the-day",
-            "X-Title": "Cartoon of the Day"
-        }
-
         data = {
             "model": self.script_model,
             "messages": [
@@ -135,7 +145,7 @@ Remember: The goal is OBVIOUS, LAUGH-OUT-LOUD humor that would make Gary Larson
         }
 
         try:
-            response = requests.post(self.openrouter_url, headers=headers, json=data)
+            response = self.session.post(self.openrouter_url, json=data, timeout=60)
             response.raise_for_status()
 
             result = response.json()
@@ -9,9 +9,15 @@ import streamlit as st
 class LocationDetector:
     """Handles location detection from browser or IP address."""
 
-    def __init__(self):
-        """Initialize the location detector."""
-        self.geolocator = Nominatim(user_agent="cartoon-of-the-day")
+    def __init__(self, geolocator=None):
+        """
+        Initialize the location detector.
+
+        Args:
+            geolocator: Optional geopy geocoder to use instead of the
+                default Nominatim instance (tests inject a mock here)
+        """
+        self.geolocator = geolocator or Nominatim(user_agent="cartoon-of-the-day")
 
     def get_browser_location(self) -> Optional[Dict[str, Any]]:
         """
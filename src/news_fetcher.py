@@ -1,10 +1,77 @@
 """News fetching using Google News for real-time news."""
 
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from gnews import GNews
-import streamlit as st
-import os
+import hashlib
+import time
+
+# diskcache persists news lookups across Streamlit restarts; caching is
+# simply disabled when it isn't installed
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Where cached news responses live and how long they stay fresh
+_NEWS_CACHE_DIR = "data/.news_cache"
+_NEWS_CACHE_TTL = 3 * 3600  # seconds
+
+# In-memory cache bound; entries are small dicts, so this is generous
+# for a single Streamlit session
+_MEM_CACHE_MAXSIZE = 256
+
+# Fictional fallback headlines as (title template, summary) pairs, built
+# once at import so the fallback path only pays for the city substitution
+_FICTIONAL_HEADLINES = (
+    ("Local government discusses new infrastructure project in {city}",
+     "City council meets to discuss improvements"),
+    ("{city} sports team advances in regional championship",
+     "Recent victory keeps hopes alive for title"),
+    ("Community event draws large crowds to {city} center",
+     "Hundreds attend annual festival celebration"),
+    ("Local business expansion announced in {city}",
+     "New jobs coming to the area"),
+    ("{city} weather forecast: Clear skies ahead",
+     "Perfect conditions for outdoor activities"),
+)
+
+
+# Common city aliases folded together so near-duplicate queries
+# ("NYC" vs "New York") share a cache entry
+_CITY_ALIASES = {
+    "nyc": "new york",
+    "new york city": "new york",
+    "la": "los angeles",
+    "sf": "san francisco",
+    "melb": "melbourne",
+}
+
+
+def _normalize_city(city: str) -> str:
+    """Canonicalize a city name for cache-key purposes."""
+    normalized = " ".join(city.lower().split())
+    return _CITY_ALIASES.get(normalized, normalized)
+
+
+def _contains_location(text: str, location_str: str, location_bytes: Optional[bytes]) -> bool:
+    """
+    Case-insensitive location match.
+
+    For ASCII city names the search runs over bytes, which avoids full
+    Unicode case folding on every article string; other names fall back
+    to the plain str path.
+    """
+    if location_bytes is not None:
+        return location_bytes in text.encode("ascii", "ignore").lower()
+    return location_str in text.lower()
+
+
+def _cache_key(city: str, country: str, date: str, num_headlines: int, sort_by: str) -> str:
+    """Build a stable cache key for a news lookup."""
+    raw = f"{_normalize_city(city)}|{country.lower()}|{date}|{num_headlines}|{sort_by}"
+    return hashlib.sha256(raw.encode()).hexdigest()
 
 
 class NewsFetcher:
@@ -21,6 +88,33 @@ class NewsFetcher:
         # Prefer news from last 2 days for freshness
         self.client = GNews(language="en", period="2d", max_results=15)
 
+        # On-disk cache so identical lookups survive Streamlit restarts
+        self._disk_cache = diskcache.Cache(_NEWS_CACHE_DIR) if diskcache else None
+
+        # In-memory TTL cache in front of the disk cache: repeat lookups
+        # within a session cost a dict access instead of a sqlite read.
+        # Maps cache key -> (expiry timestamp, news dict).
+        self._mem_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def _mem_cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a live in-memory entry for key, dropping it if expired."""
+        entry = self._mem_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._mem_cache[key]
+            return None
+        return value
+
+    def _mem_cache_set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a news dict in memory, keeping the cache bounded."""
+        if len(self._mem_cache) >= _MEM_CACHE_MAXSIZE:
+            # A session never legitimately accumulates this many distinct
+            # lookups; a full reset is simpler than LRU bookkeeping
+            self._mem_cache.clear()
+        self._mem_cache[key] = (time.monotonic() + _NEWS_CACHE_TTL, value)
+
     def fetch_local_news(
         self,
         city: str,
@@ -45,17 +139,39 @@ class NewsFetcher:
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
 
+        # Serve repeat lookups from memory first, then from the persistent
+        # cache: news for a location/date is valid for hours, so neither a
+        # rerun nor a restart should cost a fresh fetch
+        key = _cache_key(city, country, date, num_headlines, sort_by)
+        cached = self._mem_cache_get(key)
+        if cached is not None:
+            return cached
+        if self._disk_cache is not None:
+            cached = self._disk_cache.get(key)
+            if cached is not None:
+                self._mem_cache_set(key, cached)
+                return cached
+
         try:
             # Try to fetch real news from Google News
             headlines_data = self._fetch_from_google_news(city, country, date, num_headlines)
 
             if headlines_data:
+                # Fallback fictional news is deliberately never cached, so
+                # a degraded response can't poison later lookups
+                self._mem_cache_set(key, headlines_data)
+                if self._disk_cache is not None:
+                    self._disk_cache.set(key, headlines_data, expire=_NEWS_CACHE_TTL)
                 return headlines_data
             else:
                 # Fallback to fictional if API returns empty
                 return self._get_fictional_news(city, country, date, num_headlines)
 
         except Exception as e:
+            # Streamlit is only needed for the user-facing warning, so
+            # defer the (slow) import until something actually goes wrong
+            import streamlit as st
+
             st.warning(f"⚠️ Could not fetch real news: {e}. Using fictional news instead.")
             return self._get_fictional_news(city, country, date, num_headlines)
 
@@ -84,27 +200,44 @@ class NewsFetcher:
             if not articles:
                 return None
 
-            # Filter articles to ensure they're about the location
-            # Prioritize articles with city name in title (stronger signal)
-            filtered_articles_title = []
-            filtered_articles_desc = []
+            # Bound the filtering work: anything past 3x the requested
+            # headline count can never make the final cut
+            articles = articles[:num_headlines * 3]
+
+            # Filter articles to ensure they're about the location, in a
+            # single pass that stops once enough title matches are found
+            title_matches = []
+            desc_matches = []
 
             location_str = city.lower()
+            try:
+                location_bytes = location_str.encode("ascii")
+            except UnicodeEncodeError:
+                location_bytes = None
 
             for article in articles:
-                title = article.get("title", "").lower()
-                description = article.get("description", "").lower() if article.get("description") else ""
+                raw_title = article.get("title")
+                if not raw_title:
+                    # Untitled articles are dropped at extraction time;
+                    # skip the string work up front
+                    continue
 
                 # Strongly prefer articles with city in title
-                if location_str in title:
-                    filtered_articles_title.append(article)
+                if _contains_location(raw_title, location_str, location_bytes):
+                    title_matches.append(article)
+                    if len(title_matches) >= num_headlines:
+                        break
+                    continue
+
                 # Secondary: city in description (but check it's not just a passing mention)
-                elif location_str in description and len(description) > 100:
-                    filtered_articles_desc.append(article)
+                # Only the first few hundred chars matter for a location
+                # hit, so bound the case-folding/search cost per article
+                description = article.get("description") or ""
+                if len(description) > 100 and _contains_location(description[:512], location_str, location_bytes):
+                    desc_matches.append(article)
 
             # Combine: prioritize title matches, fill with description matches
-            filtered_articles = filtered_articles_title + filtered_articles_desc[:num_headlines]
-            filtered_articles = filtered_articles[:num_headlines]
+            filtered_articles = (title_matches + desc_matches)[:num_headlines]
 
             # Extract headlines with URLs
             headlines = [
@@ -114,8 +247,7 @@ class NewsFetcher:
                     "url": article.get("url", ""),
                     "source": article.get("publisher", {}).get("title", "Google News")
                 }
-                for article in filtered_articles[:num_headlines]
-                if article.get("title")
+                for article in filtered_articles
             ]
 
             # Determine dominant topic from titles
@@ -144,27 +276,9 @@ class NewsFetcher:
             "location": f"{city}, {country}",
             "date": date,
             "headlines": [
-                {
-                    "title": f"Local government discusses new infrastructure project in {city}",
-                    "summary": "City council meets to discuss improvements"
-                },
-                {
-                    "title": f"{city} sports team advances in regional championship",
-                    "summary": "Recent victory keeps hopes alive for title"
-                },
-                {
-                    "title": f"Community event draws large crowds to {city} center",
-                    "summary": "Hundreds attend annual festival celebration"
-                },
-                {
-                    "title": f"Local business expansion announced in {city}",
-                    "summary": "New jobs coming to the area"
-                },
-                {
-                    "title": f"{city} weather forecast: Clear skies ahead",
-                    "summary": "Perfect conditions for outdoor activities"
-                }
-            ][:num_headlines],
+                {"title": title.format(city=city), "summary": summary}
+                for title, summary in _FICTIONAL_HEADLINES[:num_headlines]
+            ],
             "dominant_topic": "Local News",
             "source": "Fictional (NEWSAPI_KEY not configured)"
         }
@@ -179,10 +293,13 @@ class NewsFetcher:
         Returns:
             Summary string
         """
-        if not news_data.get('headlines'):
+        return self._summary_from(news_data.get('headlines') or [])
+
+    def _summary_from(self, headlines: List[Dict[str, Any]]) -> str:
+        """Build the numbered summary string from pre-extracted headlines."""
+        if not headlines:
             return "No news available"
 
-        headlines = news_data['headlines']
         summary_parts = []
 
         for i, headline in enumerate(headlines[:5], 1):
@@ -204,13 +321,17 @@ class NewsFetcher:
         Returns:
             Dominant topic string
         """
+        return self._topic_from(news_data, news_data.get('headlines') or [])
+
+    def _topic_from(self, news_data: Dict[str, Any], headlines: List[Dict[str, Any]]) -> str:
+        """Pick the dominant topic given pre-extracted headlines."""
         # First try to use the dominant_topic from the API response
         if news_data.get('dominant_topic') and news_data['dominant_topic'] != "Error":
             return news_data['dominant_topic']
 
         # Fallback: use first headline if available
-        if news_data.get('headlines') and len(news_data['headlines']) > 0:
-            return news_data['headlines'][0].get('title', 'General News')
+        if headlines:
+            return headlines[0].get('title', 'General News')
 
         return 'General News'
 
@@ -233,6 +354,11 @@ class NewsFetcher:
         Returns:
             Dictionary with news and dominant topic
         """
+        # Resolve the default date once so the fetch and the result stamp
+        # agree (and the clock is only read a single time)
+        if date is None:
+            date = datetime.now().strftime("%Y-%m-%d")
+
         news_data = self.fetch_local_news(city, country, date, sort_by=sort_by)
         dominant_topic = self.select_dominant_topic(news_data)
 
@@ -241,10 +367,41 @@ class NewsFetcher:
             'dominant_topic': dominant_topic,
             'summary': self.get_news_summary(news_data),
             'location': f"{city}, {country}",
-            'date': date or datetime.now().strftime("%Y-%m-%d"),
+            'date': date,
             'sort_by': 'relevance'
         }
 
+    def fetch_many(
+        self,
+        locations: List[Tuple[str, str]],
+        date: Optional[str] = None,
+        max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch and summarize news for several locations in parallel.
+
+        The Google News lookups are network-bound, so running them in a
+        thread pool makes a batch cost roughly one round-trip instead of
+        one per city.
+
+        Args:
+            locations: List of (city, country) tuples
+            date: Date string applied to every lookup
+            max_workers: Upper bound on concurrent fetches
+
+        Returns:
+            List of fetch_and_summarize results, in the same order as locations
+        """
+        if not locations:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(locations))) as executor:
+            futures = [
+                executor.submit(self.fetch_and_summarize, city, country, date)
+                for city, country in locations
+            ]
+            return [future.result() for future in futures]
+
 
 def fetch_news_for_location(
     city: str,
@@ -1,30 +1,67 @@
 """Utility functions for the Cartoon of the Day application."""
 
+import functools
 import os
 import json
-from datetime import datetime
+import re
+from collections import OrderedDict
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any
-import pytz
+from typing import Optional, Dict, Any, Tuple
+from zoneinfo import ZoneInfo
+from timezonefinder import TimezoneFinder
+
+# orjson encodes straight to UTF-8 bytes several times faster than the
+# stdlib encoder; saving falls back to stdlib json when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Imported once here rather than per call inside get_api_key; guarded so
+# the module stays importable in non-Streamlit contexts (scripts, tests)
+try:
+    import streamlit as st
+except ImportError:
+    st = None
+
+
+@functools.lru_cache(maxsize=1)
+def _timezone_finder() -> TimezoneFinder:
+    """Build the TimezoneFinder once; loading its polygon index is expensive."""
+    return TimezoneFinder()
+
+
+@functools.lru_cache(maxsize=4096)
+def _timezone_name_at(lat_q: int, lng_q: int) -> Optional[str]:
+    """Resolve a timezone name for coordinates quantized to millidegrees.
+
+    Integer keys (~100 m resolution) make repeat lookups for the same
+    location a dict hit instead of a spatial query.
+    """
+    return _timezone_finder().timezone_at(lat=lat_q / 1000, lng=lng_q / 1000)
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
     """
     Retrieve the Google API key from environment or Streamlit secrets.
 
+    The key is immutable for the process lifetime, so the resolution
+    (secrets.toml parse + environment lookup) is cached after the first call.
+
     Returns:
         str: The API key
 
     Raises:
         ValueError: If API key is not found
     """
-    import streamlit as st
-
     # Try Streamlit secrets first (for deployed app)
-    try:
-        return st.secrets["GOOGLE_API_KEY"]
-    except (KeyError, FileNotFoundError):
-        pass
+    if st is not None:
+        try:
+            return st.secrets["GOOGLE_API_KEY"]
+        except (KeyError, FileNotFoundError):
+            pass
 
     # Try environment variable (for local development)
     api_key = os.getenv("GOOGLE_API_KEY")
@@ -37,6 +74,23 @@ def get_api_key() -> str:
     )
 
 
+def invalidate_api_key_cache() -> None:
+    """Forget the cached API key (used by tests and key rotation)."""
+    get_api_key.cache_clear()
+
+
+# Characters stripped from location names when building filenames
+_SAFE_LOCATION_RE = re.compile(r'[^A-Za-z0-9 _\-]')
+
+# Directories already created this process, so repeat saves skip the
+# stat/mkdir syscalls
+_ENSURED_DIRS: set = set()
+
+# Prebound formatter for filename timestamps: skips the per-call strftime
+# attribute lookup and format-string parse
+_format_timestamp = "{:%Y%m%d_%H%M%S}".format
+
+
 def save_cartoon_data(
     location: str,
     cartoon_data: Dict[str, Any],
@@ -55,20 +109,25 @@ def save_cartoon_data(
     Returns:
         Path: Path to saved JSON file
     """
-    # Create data directory if it doesn't exist
-    data_dir = Path("data/cartoons")
-    data_dir.mkdir(parents=True, exist_ok=True)
+    # This mutates cartoon_data below, so stale validation results must go
+    _clear_validation_caches()
 
-    # Generate filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_location = "".join(c for c in location if c.isalnum() or c in (' ', '-', '_'))
-    safe_location = safe_location.replace(' ', '_')
+    # Create data directory if it doesn't exist (once per process)
+    data_dir = Path("data/cartoons")
+    if data_dir not in _ENSURED_DIRS:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(data_dir)
+
+    # Sample the clock once so the filename and metadata timestamps agree
+    now = datetime.now()
+    timestamp = _format_timestamp(now)
+    safe_location = _SAFE_LOCATION_RE.sub('', location).replace(' ', '_')
     filename = f"{safe_location}_{timestamp}.json"
 
     # Add metadata
     cartoon_data["metadata"] = {
         "location": location,
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": now.isoformat(),
         "image_path": str(image_path) if image_path else None
     }
 
@@ -76,10 +135,21 @@ def save_cartoon_data(
     if news_data:
         cartoon_data["news_data"] = news_data
 
-    # Save JSON
+    # Serialize up front so the file sees one bulk write instead of the
+    # encoder's incremental chunks
+    if orjson is not None:
+        payload = orjson.dumps(cartoon_data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(cartoon_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    # Write to a sibling temp file and rename into place: os.replace is
+    # atomic, so an interrupted save can never leave a truncated JSON
+    # file behind for later pipeline stages to choke on
     output_path = data_dir / filename
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(cartoon_data, f, indent=2, ensure_ascii=False)
+    tmp_path = data_dir / f"{filename}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, output_path)
 
     return output_path
 
@@ -95,21 +165,19 @@ def get_local_time(latitude: float, longitude: float) -> datetime:
     Returns:
         datetime: Current local time with timezone
     """
-    from timezonefinder import TimezoneFinder
-
     try:
-        tf = TimezoneFinder()
-        timezone_str = tf.timezone_at(lat=latitude, lng=longitude)
+        timezone_str = _timezone_name_at(round(latitude * 1000), round(longitude * 1000))
 
         if timezone_str:
-            local_tz = pytz.timezone(timezone_str)
-            return datetime.now(local_tz)
+            # ZoneInfo caches constructed zones internally, so repeat
+            # lookups never re-read the zoneinfo files
+            return datetime.now(ZoneInfo(timezone_str))
     except (ValueError, Exception):
         # Invalid coordinates or other errors
         pass
 
     # Fallback to UTC
-    return datetime.now(pytz.UTC)
+    return datetime.now(timezone.utc)
 
 
 def format_date_for_location(latitude: float, longitude: float) -> str:
@@ -127,6 +195,28 @@ def format_date_for_location(latitude: float, longitude: float) -> str:
     return local_time.strftime("%A, %B %d, %Y")
 
 
+_ALLOWED_FILENAME_CHARS = frozenset(
+    "-_.() abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+)
+
+
+class _SanitizeTable(dict):
+    """Lazily built str.translate table: drop invalid chars, map space to '_'.
+
+    Entries are computed on first sight of each codepoint, so the table only
+    ever holds characters that actually appear in filenames.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        result = char if char in _ALLOWED_FILENAME_CHARS else None
+        self[codepoint] = result
+        return result
+
+
+_SANITIZE_TABLE = _SanitizeTable({ord(" "): ord("_")})
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename by removing invalid characters.
@@ -137,10 +227,54 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: Sanitized filename
     """
-    # Remove invalid characters
-    valid_chars = "-_.() abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-    sanitized = ''.join(c for c in filename if c in valid_chars)
-    return sanitized.replace(' ', '_')
+    # translate() scans the string in a single C-level pass
+    return filename.translate(_SANITIZE_TABLE)
+
+
+# Required-field schemas, fixed at module load so validation is a single
+# C-level subset check instead of a per-field probe
+_LOCATION_REQUIRED = frozenset(('latitude', 'longitude'))
+_CARTOON_REQUIRED = frozenset(('topic', 'location', 'ideas', 'ranking', 'winner'))
+_IDEA_REQUIRED = frozenset(('title', 'premise', 'why_funny'))
+
+# Identity-keyed LRU caches so re-validating the same dict within a rerun
+# is a single lookup. Each entry stores the dict alongside its result: an
+# id is only unique while its object is alive, so holding the reference
+# keeps CPython from recycling the address for a different dict that would
+# then inherit a stale verdict. Dicts are mutable, so the caches are also
+# flushed whenever save_cartoon_data mutates a payload; one cache per
+# validator keeps reused object ids from crossing schemas.
+_VALIDATION_CACHE_MAX = 64
+_CARTOON_VALIDATION_CACHE: "OrderedDict[int, Tuple[Dict[str, Any], bool]]" = OrderedDict()
+_LOCATION_VALIDATION_CACHE: "OrderedDict[int, Tuple[Dict[str, Any], bool]]" = OrderedDict()
+
+
+def _cached_validation(
+    cache: "OrderedDict[int, Tuple[Dict[str, Any], bool]]", data: Dict[str, Any], check
+) -> bool:
+    """Look up a validation result by object identity, computing on miss."""
+    key = id(data)
+    entry = cache.get(key)
+    if entry is not None:
+        cache.move_to_end(key)
+        return entry[1]
+
+    result = check(data)
+    cache[key] = (data, result)
+    if len(cache) > _VALIDATION_CACHE_MAX:
+        cache.popitem(last=False)
+    return result
+
+
+def _clear_validation_caches() -> None:
+    """Drop cached validation results (called when payloads are mutated)."""
+    _CARTOON_VALIDATION_CACHE.clear()
+    _LOCATION_VALIDATION_CACHE.clear()
+
+
+def _check_location_data(location_data: Dict[str, Any]) -> bool:
+    """Uncached location validation."""
+    return _LOCATION_REQUIRED <= location_data.keys()
 
 
 def validate_location_data(location_data: Dict[str, Any]) -> bool:
@@ -153,8 +287,7 @@ def validate_location_data(location_data: Dict[str, Any]) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    required_fields = ['latitude', 'longitude']
-    return all(field in location_data for field in required_fields)
+    return _cached_validation(_LOCATION_VALIDATION_CACHE, location_data, _check_location_data)
 
 
 def validate_cartoon_data(cartoon_data: Dict[str, Any]) -> bool:
@@ -167,21 +300,29 @@ def validate_cartoon_data(cartoon_data: Dict[str, Any]) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    required_fields = ['topic', 'location', 'ideas', 'ranking', 'winner']
+    return _cached_validation(_CARTOON_VALIDATION_CACHE, cartoon_data, _check_cartoon_data)
+
 
-    if not all(field in cartoon_data for field in required_fields):
+def _check_cartoon_data(cartoon_data: Dict[str, Any]) -> bool:
+    """Uncached cartoon validation, ordered cheapest check first."""
+    if not isinstance(cartoon_data, dict):
         return False
 
-    # Validate ideas structure
-    if not isinstance(cartoon_data['ideas'], list) or len(cartoon_data['ideas']) != 5:
+    if not _CARTOON_REQUIRED <= cartoon_data.keys():
         return False
 
-    for idea in cartoon_data['ideas']:
-        if not all(key in idea for key in ['title', 'premise', 'why_funny']):
-            return False
+    # Validate ideas structure
+    ideas = cartoon_data['ideas']
+    if not isinstance(ideas, list) or len(ideas) != 5:
+        return False
 
-    # Validate ranking
-    if not isinstance(cartoon_data['ranking'], list) or len(cartoon_data['ranking']) != 5:
+    # Validate ranking before walking the ideas: it's a single length check
+    ranking = cartoon_data['ranking']
+    if not isinstance(ranking, list) or len(ranking) != 5:
         return False
 
+    for idea in ideas:
+        if not _IDEA_REQUIRED.issubset(idea):
+            return False
+
     return True
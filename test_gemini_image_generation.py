@@ -9,26 +9,31 @@ import google.generativeai as genai
 from PIL import Image
 import io
 
+from gemini_test_utils import available_model_names, get_model, probe_model
+
 # Load environment variables
 load_dotenv()
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Resolve the key and configure the SDK once at import time; the tests
+# below just reuse this instead of re-reading the environment
+API_KEY = os.getenv('GOOGLE_API_KEY')
+if API_KEY:
+    genai.configure(api_key=API_KEY)
+
 def test_gemini_models():
     """Test that Gemini models are available and configured correctly."""
     print("=" * 60)
     print("TESTING GEMINI MODELS AVAILABILITY")
     print("=" * 60)
 
-    api_key = os.getenv('GOOGLE_API_KEY')
-    if not api_key:
+    if not API_KEY:
         print("❌ GOOGLE_API_KEY not found in environment")
         return False
     else:
-        print(f"✅ API Key found: {api_key[:10]}...")
-
-    genai.configure(api_key=api_key)
+        print(f"✅ API Key found: {API_KEY[:10]}...")
 
     # Test each model we use
     models_to_test = [
@@ -42,17 +47,12 @@ def test_gemini_models():
 
     for model_name, purpose in models_to_test:
         print(f"\n{model_name} ({purpose}):")
-        try:
-            model = genai.GenerativeModel(model_name)
-            # Try a simple generation
-            response = model.generate_content("Say 'hello' in one word")
-            if response and response.text:
-                print(f"  ✅ Model works! Response: {response.text.strip()}")
-            else:
-                print(f"  ⚠️ Model responded but no text returned")
-                all_models_work = False
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
+        # probe_model caches the round-trip, so re-checking a model name
+        # anywhere else in the run costs nothing
+        if probe_model(model_name):
+            print(f"  ✅ Model works!")
+        else:
+            print(f"  ❌ Model unavailable or returned no text")
             all_models_work = False
 
     return all_models_work
@@ -64,14 +64,11 @@ def test_image_generation():
     print("TESTING IMAGE GENERATION")
     print("=" * 60)
 
-    api_key = os.getenv('GOOGLE_API_KEY')
-    genai.configure(api_key=api_key)
-
     # Test with gemini-2.5-flash-image
     print("\nTrying to generate an image with gemini-2.5-flash-image...")
 
     try:
-        model = genai.GenerativeModel('gemini-2.5-flash-image')
+        model = get_model('gemini-2.5-flash-image')
 
         prompt = """Create a simple cartoon image of a cat wearing a hat.
 
@@ -132,9 +129,6 @@ def test_alternative_image_models():
     print("TESTING ALTERNATIVE IMAGE GENERATION MODELS")
     print("=" * 60)
 
-    api_key = os.getenv('GOOGLE_API_KEY')
-    genai.configure(api_key=api_key)
-
     # List of potential image generation models to try
     alternative_models = [
         'gemini-2.5-flash-image',
@@ -146,8 +140,14 @@ def test_alternative_image_models():
 
     for model_name in alternative_models:
         print(f"\nTrying {model_name}...")
+
+        # Skip the round-trip for anything the API doesn't even list
+        if model_name not in available_model_names():
+            print(f"  ❌ {model_name} not listed by the API")
+            continue
+
         try:
-            model = genai.GenerativeModel(model_name)
+            model = get_model(model_name)
 
             # Try to generate an image
             prompt = "Generate a simple cartoon of a happy sun"
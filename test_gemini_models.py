@@ -2,32 +2,39 @@
 """Test which Gemini models support image generation."""
 
 import os
+import sys
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from gemini_test_utils import available_model_names, get_model
+
 load_dotenv()
-api_key = os.getenv('GOOGLE_API_KEY')
-genai.configure(api_key=api_key)
 
-# List all available models
-print("Available Gemini Models:")
-print("=" * 60)
+# Resolved once for the whole script run
+API_KEY = os.getenv('GOOGLE_API_KEY')
+if API_KEY:
+    genai.configure(api_key=API_KEY)
+
+# List all available models, buffering the report so dozens of models
+# cost one stdout write instead of several per model
+out = ["Available Gemini Models:", "=" * 60]
 
 for model in genai.list_models():
-    print(f"\nModel: {model.name}")
-    print(f"  Display Name: {model.display_name}")
-    print(f"  Supported Methods: {model.supported_generation_methods}")
+    out.append(f"\nModel: {model.name}")
+    out.append(f"  Display Name: {model.display_name}")
+    out.append(f"  Supported Methods: {model.supported_generation_methods}")
 
     # Check if it supports image generation
     if 'generateImage' in model.supported_generation_methods:
-        print("  ✅ SUPPORTS IMAGE GENERATION!")
+        out.append("  ✅ SUPPORTS IMAGE GENERATION!")
     elif 'generateContent' in model.supported_generation_methods:
         # Check if the model name suggests image capabilities
         if 'image' in model.name.lower() or 'imagen' in model.name.lower() or 'vision' in model.name.lower():
-            print("  🔍 May support images (has 'image' in name)")
+            out.append("  🔍 May support images (has 'image' in name)")
 
-print("\n" + "=" * 60)
-print("\nTesting specific models for image generation capability:")
+out.append("\n" + "=" * 60)
+out.append("\nTesting specific models for image generation capability:")
+sys.stdout.write("\n".join(out) + "\n")
 
 # Test models that might support image generation
 test_models = [
@@ -41,10 +48,19 @@ test_models = [
     'imagen-3.0-fast-generate-001'
 ]
 
+# Buffer this report the same way and flush it once at the end
+out = []
+
 for model_name in test_models:
-    print(f"\nTesting {model_name}:")
+    out.append(f"\nTesting {model_name}:")
+
+    # Skip the network probe entirely for models the API doesn't list
+    if model_name not in available_model_names():
+        out.append("  ❌ Model not listed by the API")
+        continue
+
     try:
-        model = genai.GenerativeModel(model_name)
+        model = get_model(model_name)
 
         # Try to generate an image
         prompt = "Generate a simple cartoon image of a happy sun"
@@ -58,18 +74,20 @@ for model_name in test_models:
                     for part in candidate.content.parts:
                         if hasattr(part, 'inline_data') and part.inline_data.mime_type.startswith('image/'):
                             has_image = True
-                            print(f"  ✅ Generated image! MIME: {part.inline_data.mime_type}")
+                            out.append(f"  ✅ Generated image! MIME: {part.inline_data.mime_type}")
                             break
 
         if not has_image:
             if hasattr(response, 'text'):
-                print(f"  ❌ Text-only response (first 50 chars): {response.text[:50]}")
+                out.append(f"  ❌ Text-only response (first 50 chars): {response.text[:50]}")
             else:
-                print(f"  ❌ No image in response")
+                out.append(f"  ❌ No image in response")
 
     except Exception as e:
         error_msg = str(e)
         if 'not found' in error_msg.lower():
-            print(f"  ❌ Model not found")
+            out.append(f"  ❌ Model not found")
         else:
-            print(f"  ❌ Error: {error_msg[:100]}")
\ No newline at end of file
+            out.append(f"  ❌ Error: {error_msg[:100]}")
+
+sys.stdout.write("\n".join(out) + "\n")
\ No newline at end of file
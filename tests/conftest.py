@@ -0,0 +1,37 @@
+"""Shared pytest fixtures."""
+
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+# streamlit_js_eval drags in Streamlit's custom-component machinery at import
+# just to expose get_geolocation, which every test mocks anyway. Register a
+# lightweight stub before anything imports the real package so the browser
+# geolocation tests never pay that import (or need it installed).
+_js_eval_stub = types.ModuleType("streamlit_js_eval")
+_js_eval_stub.get_geolocation = MagicMock(name="get_geolocation")
+sys.modules.setdefault("streamlit_js_eval", _js_eval_stub)
+
+# google.generativeai pulls in the protobuf/grpc/auth stacks at import, and
+# every test that touches it replaces the module attribute with a mock
+# anyway. A stub carrying the three symbols the src modules reference keeps
+# that import graph out of pytest startup entirely.
+_genai_stub = types.ModuleType("google.generativeai")
+_genai_stub.configure = MagicMock(name="genai.configure")
+_genai_stub.GenerationConfig = MagicMock(name="genai.GenerationConfig")
+_genai_stub.GenerativeModel = MagicMock(name="genai.GenerativeModel")
+sys.modules.setdefault("google.generativeai", _genai_stub)
+
+from src import news_fetcher
+
+
+@pytest.fixture(autouse=True)
+def isolated_news_cache(tmp_path, monkeypatch):
+    """Point NewsFetcher's persistent cache at a per-test directory.
+
+    Keeps cached responses from one test (or a previous run) from leaking
+    into another, and keeps the repo's data directory clean.
+    """
+    monkeypatch.setattr(news_fetcher, "_NEWS_CACHE_DIR", str(tmp_path / "news_cache"))
@@ -1,67 +1,69 @@
 """Basic tests for the Streamlit app."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, Mock
 from pathlib import Path
 
 
+class MockSessionState(dict):
+    """Attribute-style access over a plain dict, mirroring st.session_state."""
+
+    # Bound C method is faster than a Python-level wrapper
+    __setattr__ = dict.__setitem__
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+
+@pytest.fixture
+def mock_session_state():
+    """Fresh MockSessionState instance per test."""
+    return MockSessionState()
+
+
+# Functions the app module must expose (module-level so the tuple isn't
+# rebuilt per test)
+REQUIRED_FUNCTIONS = (
+    'initialize_session_state',
+    'display_header',
+    'location_section',
+    'generate_cartoon_section',
+    'display_cartoon_results',
+    'main'
+)
+
+
+@pytest.fixture(scope='session')
+def app_mod():
+    """Import the Streamlit app once for the whole test session."""
+    import app
+    return app
+
+
 class TestAppStructure:
     """Test the app structure and imports."""
 
-    def test_app_imports(self):
+    def test_app_imports(self, app_mod):
         """Test that app.py can be imported without errors."""
-        try:
-            import app
-            assert app is not None
-        except ImportError as e:
-            pytest.fail(f"Failed to import app: {e}")
-
-    def test_app_has_main_function(self):
-        """Test that app has a main function."""
-        import app
-        assert hasattr(app, 'main')
-        assert callable(app.main)
-
-    def test_app_has_required_functions(self):
-        """Test that app has all required functions."""
-        import app
-
-        required_functions = [
-            'initialize_session_state',
-            'display_header',
-            'location_section',
-            'generate_cartoon_section',
-            'display_cartoon_results',
-            'main'
-        ]
-
-        for func_name in required_functions:
-            assert hasattr(app, func_name), f"Missing function: {func_name}"
-            assert callable(getattr(app, func_name)), f"{func_name} is not callable"
+        assert app_mod is not None
+
+    @pytest.mark.parametrize('func_name', REQUIRED_FUNCTIONS)
+    def test_app_has_required_functions(self, app_mod, func_name):
+        """Test that each required app function exists and is callable."""
+        assert hasattr(app_mod, func_name), f"Missing function: {func_name}"
+        assert callable(getattr(app_mod, func_name)), f"{func_name} is not callable"
 
 
 class TestSessionStateInitialization:
     """Test session state initialization."""
 
-    def test_initialize_session_state(self):
+    def test_initialize_session_state(self, app_mod, mock_session_state):
         """Test that session state is properly initialized."""
-        import app
-
-        # Create a proper mock for session_state
-        class MockSessionState(dict):
-            def __setattr__(self, key, value):
-                self[key] = value
-
-            def __getattr__(self, key):
-                try:
-                    return self[key]
-                except KeyError:
-                    raise AttributeError(key)
-
-        mock_session_state = MockSessionState()
-
         with patch('app.st.session_state', mock_session_state):
-            app.initialize_session_state()
+            app_mod.initialize_session_state()
 
             # Verify all required keys are initialized
             assert 'location_data' in mock_session_state
@@ -81,66 +83,27 @@ class TestSessionStateInitialization:
 class TestAppConfiguration:
     """Test app configuration."""
 
-    def test_imports_all_required_modules(self):
+    def test_imports_all_required_modules(self, app_mod):
         """Test that all required modules are imported."""
-        import app
-
         # Check that key modules are accessible
-        assert hasattr(app, 'LocationDetector')
-        assert hasattr(app, 'NewsFetcher')
-        assert hasattr(app, 'CartoonGenerator')
-        assert hasattr(app, 'ImageGenerator')
+        assert hasattr(app_mod, 'LocationDetector')
+        assert hasattr(app_mod, 'NewsFetcher')
+        assert hasattr(app_mod, 'CartoonGenerator')
+        assert hasattr(app_mod, 'ImageGenerator')
 
-    def test_streamlit_imports(self):
+    def test_streamlit_imports(self, app_mod):
         """Test that Streamlit is properly imported."""
-        import app
-        assert hasattr(app, 'st')
-
-
-class TestUtilityFunctions:
-    """Test utility functions used in the app."""
-
-    def test_display_header_exists(self):
-        """Test that display_header function exists."""
-        import app
-        assert callable(app.display_header)
-
-    def test_location_section_exists(self):
-        """Test that location_section function exists."""
-        import app
-        assert callable(app.location_section)
-
-    def test_generate_cartoon_section_exists(self):
-        """Test that generate_cartoon_section function exists."""
-        import app
-        assert callable(app.generate_cartoon_section)
-
-    def test_display_cartoon_results_exists(self):
-        """Test that display_cartoon_results function exists."""
-        import app
-        assert callable(app.display_cartoon_results)
+        assert hasattr(app_mod, 'st')
 
 
 class TestAppIntegration:
     """Integration tests for app workflow."""
 
+    @pytest.mark.integration
     @patch('app.st')
-    def test_app_main_runs_without_error(self, mock_st):
+    def test_app_main_runs_without_error(self, mock_st, app_mod, mock_session_state):
         """Test that main function runs without immediate errors."""
-        import app
-
-        # Create a proper mock for session_state
-        class MockSessionState(dict):
-            def __setattr__(self, key, value):
-                self[key] = value
-
-            def __getattr__(self, key):
-                try:
-                    return self[key]
-                except KeyError:
-                    raise AttributeError(key)
-
-        mock_session_state = MockSessionState({
+        mock_session_state.update({
             'location_data': None,
             'address_data': None,
             'news_data': None,
@@ -148,21 +111,24 @@ class TestAppIntegration:
             'image_path': None
         })
 
-        # Mock streamlit functions
+        # Mock streamlit functions: plain Mock is several times cheaper to
+        # build than MagicMock and these are just call sinks. Only the
+        # columns/tabs children stay MagicMock, since they are used as
+        # context managers and need the magic-method machinery.
         mock_st.session_state = mock_session_state
-        mock_st.set_page_config = MagicMock()
-        mock_st.markdown = MagicMock()
-        mock_st.subheader = MagicMock()
-        mock_st.columns = MagicMock(return_value=[MagicMock(), MagicMock()])
-        mock_st.tabs = MagicMock(return_value=[MagicMock(), MagicMock()])
-        mock_st.button = MagicMock(return_value=False)
-        mock_st.text_input = MagicMock(return_value="")
-        mock_st.info = MagicMock()
-        mock_st.rerun = MagicMock()
+        mock_st.set_page_config = Mock()
+        mock_st.markdown = Mock()
+        mock_st.subheader = Mock()
+        mock_st.columns = Mock(return_value=[MagicMock(), MagicMock()])
+        mock_st.tabs = Mock(return_value=[MagicMock(), MagicMock()])
+        mock_st.button = Mock(return_value=False)
+        mock_st.text_input = Mock(return_value="")
+        mock_st.info = Mock()
+        mock_st.rerun = Mock()
 
         # Run main - should not raise any exceptions
         try:
-            app.main()
+            app_mod.main()
         except Exception as e:
             # Some exceptions are expected due to mocking
             # but major structural issues should not occur
@@ -2,113 +2,118 @@
 
 import pytest
 import json
-from unittest.mock import patch, MagicMock, Mock
-from src.cartoon_generator import CartoonGenerator, generate_cartoons_from_news
+from unittest.mock import patch, MagicMock, Mock, DEFAULT
+from src.cartoon_generator import (
+    CartoonGenerator,
+    generate_cartoons_from_news,
+    _extract_json_object
+)
+
+# One canonical well-formed model response shared by the happy-path tests,
+# assembled from frozen templates and serialized once at import
+_IDEAS = tuple(
+    {"title": f"Cartoon {i}", "premise": f"Premise {i}", "why_funny": f"Funny {i}"}
+    for i in range(1, 6)
+)
+_RANKING = tuple(f"Cartoon {i}" for i in range(1, 6))
+
+VALID_RESPONSE = {
+    "topic": "Local Politics",
+    "location": "Melbourne, Australia",
+    "ideas": list(_IDEAS),
+    "ranking": list(_RANKING),
+    "winner": "Cartoon 1"
+}
+VALID_RESPONSE_JSON = json.dumps(VALID_RESPONSE)
+MARKDOWN_WRAPPED = f"```json\n{VALID_RESPONSE_JSON}\n```"
+
+
+class TestExtractJsonObject:
+    """Tests for the _extract_json_object helper."""
+
+    def test_extract_plain_json(self):
+        """Test extraction when text is already a bare JSON object."""
+        text = '{"topic": "Sports", "winner": "Cartoon 1"}'
+        assert _extract_json_object(text) == text
+
+    def test_extract_from_markdown_fence(self):
+        """Test extraction of JSON wrapped in a markdown code block."""
+        payload = '{"topic": "Sports"}'
+        text = f"```json\n{payload}\n```"
+        assert _extract_json_object(text) == payload
+
+    def test_extract_with_braces_inside_strings(self):
+        """Test that braces inside string values don't break the scan."""
+        payload = '{"premise": "A \\"quoted\\" joke about {curly} braces"}'
+        assert _extract_json_object(payload) == payload
+
+    def test_extract_nested_objects(self):
+        """Test extraction of nested JSON objects."""
+        payload = '{"outer": {"inner": {"deep": 1}}}'
+        text = f"Here is the result: {payload} hope it helps"
+        assert _extract_json_object(text) == payload
+
+    def test_extract_no_json(self):
+        """Test that text without a JSON object returns None."""
+        assert _extract_json_object("No JSON here at all") is None
+
+    def test_extract_unbalanced_json(self):
+        """Test that a truncated JSON object returns None."""
+        assert _extract_json_object('{"topic": "Sports"') is None
 
 
 class TestCartoonGenerator:
     """Tests for CartoonGenerator class."""
 
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_init_with_api_key(self, mock_model, mock_configure, mock_get_key):
+    @pytest.fixture(autouse=True)
+    def gemini_mocks(self):
+        """Mock get_api_key and the genai SDK once for every test.
+
+        Replaces the triple @patch stack each test used to carry; yields
+        the mock namespace so tests can tune model behavior as needed.
+        """
+        with patch.multiple(
+            'src.cartoon_generator', get_api_key=DEFAULT, genai=DEFAULT
+        ) as mocks:
+            mocks['get_api_key'].return_value = "test-key"
+            yield mocks
+
+    def test_init_with_api_key(self, gemini_mocks):
         """Test CartoonGenerator initialization with API key."""
         generator = CartoonGenerator(api_key="test-key")
         assert generator.api_key == "test-key"
-        mock_configure.assert_called_once_with(api_key="test-key")
+        gemini_mocks['genai'].configure.assert_called_once_with(api_key="test-key")
 
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_init_without_api_key(self, mock_model, mock_configure, mock_get_key):
+    def test_init_without_api_key(self, gemini_mocks):
         """Test CartoonGenerator initialization without API key."""
-        mock_get_key.return_value = "fetched-key"
+        gemini_mocks['get_api_key'].return_value = "fetched-key"
         generator = CartoonGenerator()
         assert generator.api_key == "fetched-key"
-        mock_configure.assert_called_once_with(api_key="fetched-key")
-
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_generate_concepts_success(self, mock_model_class, mock_configure, mock_get_key):
-        """Test successful cartoon concept generation."""
-        mock_get_key.return_value = "test-key"
-
-        # Create valid cartoon data
-        valid_response = {
-            "topic": "Local Politics",
-            "location": "Melbourne, Australia",
-            "ideas": [
-                {"title": "Cartoon 1", "premise": "Premise 1", "why_funny": "Funny 1"},
-                {"title": "Cartoon 2", "premise": "Premise 2", "why_funny": "Funny 2"},
-                {"title": "Cartoon 3", "premise": "Premise 3", "why_funny": "Funny 3"},
-                {"title": "Cartoon 4", "premise": "Premise 4", "why_funny": "Funny 4"},
-                {"title": "Cartoon 5", "premise": "Premise 5", "why_funny": "Funny 5"}
-            ],
-            "ranking": ["Cartoon 1", "Cartoon 2", "Cartoon 3", "Cartoon 4", "Cartoon 5"],
-            "winner": "Cartoon 1"
-        }
-
-        mock_model = MagicMock()
+        gemini_mocks['genai'].configure.assert_called_once_with(api_key="fetched-key")
+
+    @pytest.mark.parametrize(
+        "payload",
+        [VALID_RESPONSE_JSON, MARKDOWN_WRAPPED],
+        ids=["plain-json", "markdown-wrapped"]
+    )
+    def test_generate_concepts_success(self, gemini_mocks, payload):
+        """Test concept generation for plain and markdown-wrapped JSON."""
         mock_response = MagicMock()
-        mock_response.text = json.dumps(valid_response)
-        mock_model.generate_content.return_value = mock_response
-        mock_model_class.return_value = mock_model
+        mock_response.text = payload
+        model = gemini_mocks['genai'].GenerativeModel.return_value
+        model.generate_content.return_value = mock_response
 
         generator = CartoonGenerator()
         result = generator.generate_concepts("Local Politics", "Melbourne, Australia")
 
-        assert result['topic'] == "Local Politics"
-        assert result['location'] == "Melbourne, Australia"
-        assert len(result['ideas']) == 5
-        assert len(result['ranking']) == 5
-        assert result['winner'] == "Cartoon 1"
-
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_generate_concepts_with_markdown(self, mock_model_class, mock_configure, mock_get_key):
-        """Test cartoon generation with markdown-wrapped JSON."""
-        mock_get_key.return_value = "test-key"
+        # Compare against the source dict in one deep-equality walk; the
+        # projection tolerates extra keys the generator may add
+        assert {k: result[k] for k in VALID_RESPONSE} == VALID_RESPONSE
 
-        valid_response = {
-            "topic": "Sports",
-            "location": "Paris, France",
-            "ideas": [
-                {"title": "Cartoon 1", "premise": "Premise 1", "why_funny": "Funny 1"},
-                {"title": "Cartoon 2", "premise": "Premise 2", "why_funny": "Funny 2"},
-                {"title": "Cartoon 3", "premise": "Premise 3", "why_funny": "Funny 3"},
-                {"title": "Cartoon 4", "premise": "Premise 4", "why_funny": "Funny 4"},
-                {"title": "Cartoon 5", "premise": "Premise 5", "why_funny": "Funny 5"}
-            ],
-            "ranking": ["Cartoon 1", "Cartoon 2", "Cartoon 3", "Cartoon 4", "Cartoon 5"],
-            "winner": "Cartoon 1"
-        }
-
-        mock_model = MagicMock()
-        mock_response = MagicMock()
-        # Wrap in markdown code block
-        mock_response.text = f"```json\n{json.dumps(valid_response)}\n```"
-        mock_model.generate_content.return_value = mock_response
-        mock_model_class.return_value = mock_model
-
-        generator = CartoonGenerator()
-        result = generator.generate_concepts("Sports", "Paris, France")
-
-        assert result['topic'] == "Sports"
-        assert len(result['ideas']) == 5
-
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_generate_concepts_error(self, mock_model_class, mock_configure, mock_get_key):
+    def test_generate_concepts_error(self, gemini_mocks):
         """Test cartoon generation with error."""
-        mock_get_key.return_value = "test-key"
-
-        mock_model = MagicMock()
-        mock_model.generate_content.side_effect = Exception("API Error")
-        mock_model_class.return_value = mock_model
+        model = gemini_mocks['genai'].GenerativeModel.return_value
+        model.generate_content.side_effect = Exception("API Error")
 
         generator = CartoonGenerator()
         result = generator.generate_concepts("Topic", "Location")
@@ -116,13 +121,8 @@ class TestCartoonGenerator:
         assert 'error' in result
         assert len(result['ideas']) == 5  # Fallback response
 
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_build_generation_prompt(self, mock_model_class, mock_configure, mock_get_key):
+    def test_build_generation_prompt(self, gemini_mocks):
         """Test prompt building."""
-        mock_get_key.return_value = "test-key"
-
         generator = CartoonGenerator()
         prompt = generator._build_generation_prompt("Sports", "Paris, France", "News context")
 
@@ -132,89 +132,42 @@ class TestCartoonGenerator:
         # Structured output handles JSON formatting, check for spelling emphasis instead
         assert "spell correctly" in prompt
 
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_parse_response_valid_json(self, mock_model_class, mock_configure, mock_get_key):
+    def test_parse_response_valid_json(self, gemini_mocks):
         """Test parsing valid JSON response."""
-        mock_get_key.return_value = "test-key"
-
-        valid_data = {
-            "topic": "Test",
-            "location": "Test Location",
-            "ideas": [],
-            "ranking": [],
-            "winner": ""
-        }
-
         generator = CartoonGenerator()
-        result = generator._parse_response(json.dumps(valid_data), "Test", "Test Location")
-
-        assert result['topic'] == "Test"
-        assert result['location'] == "Test Location"
+        result = generator._parse_response(
+            VALID_RESPONSE_JSON, "Local Politics", "Melbourne, Australia"
+        )
 
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_parse_response_invalid_json(self, mock_model_class, mock_configure, mock_get_key):
-        """Test parsing invalid JSON response."""
-        mock_get_key.return_value = "test-key"
+        assert result['topic'] == "Local Politics"
+        assert result['location'] == "Melbourne, Australia"
 
+    @pytest.mark.parametrize("method_name,args,expect_error", [
+        ("_parse_response", ("Not valid JSON", "Test", "Test Location"), True),
+        ("_fix_cartoon_data",
+         ({"topic": "Test", "location": "Test Location",
+           "ideas": [{"title": "Only One"}], "ranking": []},
+          "Test", "Test Location"),
+         False),
+        ("_create_fallback_response", ("Test", "Test Location", "Error"), True),
+    ])
+    def test_recovery_paths_produce_full_structure(
+        self, gemini_mocks, method_name, args, expect_error
+    ):
+        """Every recovery path yields five ideas, five rankings and a winner."""
         generator = CartoonGenerator()
-        result = generator._parse_response("Not valid JSON", "Test", "Test Location")
+        result = getattr(generator, method_name)(*args)
 
-        # Should return fallback response
         assert result['topic'] == "Test"
         assert result['location'] == "Test Location"
         assert len(result['ideas']) == 5
-
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_fix_cartoon_data(self, mock_model_class, mock_configure, mock_get_key):
-        """Test fixing invalid cartoon data."""
-        mock_get_key.return_value = "test-key"
-
-        invalid_data = {
-            "topic": "Test",
-            "location": "Test Location",
-            "ideas": [
-                {"title": "Only One"}
-            ],
-            "ranking": []
-        }
-
-        generator = CartoonGenerator()
-        result = generator._fix_cartoon_data(invalid_data, "Test", "Test Location")
-
-        assert len(result['ideas']) == 5
-        assert len(result['ranking']) == 5
-        assert 'winner' in result
-
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_create_fallback_response(self, mock_model_class, mock_configure, mock_get_key):
-        """Test creating fallback response."""
-        mock_get_key.return_value = "test-key"
-
-        generator = CartoonGenerator()
-        result = generator._create_fallback_response("Test Topic", "Test Location", "Error")
-
-        assert result['topic'] == "Test Topic"
-        assert result['location'] == "Test Location"
-        assert len(result['ideas']) == 5
         assert len(result['ranking']) == 5
         assert 'winner' in result
-        assert 'error' in result
+        if expect_error:
+            assert 'error' in result
 
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_get_winner(self, mock_model_class, mock_configure, mock_get_key):
+    def test_get_winner(self, gemini_mocks):
         """Test extracting winner from cartoon data."""
-        mock_get_key.return_value = "test-key"
-
         cartoon_data = {
             "topic": "Sports",
             "location": "Paris, France",
@@ -233,13 +186,8 @@ class TestCartoonGenerator:
         assert winner['premise'] == "Winning premise"
         assert winner['why_funny'] == "Very funny"
 
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_get_winner_not_found(self, mock_model_class, mock_configure, mock_get_key):
+    def test_get_winner_not_found(self, gemini_mocks):
         """Test getting winner when winner not in ideas."""
-        mock_get_key.return_value = "test-key"
-
         cartoon_data = {
             "ideas": [
                 {"title": "First", "premise": "First premise", "why_funny": "Funny"}
@@ -253,13 +201,8 @@ class TestCartoonGenerator:
         # Should fall back to first idea
         assert winner['title'] == "First"
 
-    @patch('src.cartoon_generator.get_api_key')
-    @patch('src.cartoon_generator.genai.configure')
-    @patch('src.cartoon_generator.genai.GenerativeModel')
-    def test_rank_concepts(self, mock_model_class, mock_configure, mock_get_key):
+    def test_rank_concepts(self, gemini_mocks):
         """Test ranking concepts in order."""
-        mock_get_key.return_value = "test-key"
-
         cartoon_data = {
             "ideas": [
                 {"title": "Third", "premise": "3rd", "why_funny": "Funny"},
@@ -280,10 +223,12 @@ class TestCartoonGenerator:
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
-    @patch('src.cartoon_generator.CartoonGenerator')
+    @patch('src.cartoon_generator.CartoonGenerator', autospec=True)
     def test_generate_cartoons_from_news(self, mock_generator_class):
         """Test generate_cartoons_from_news convenience function."""
-        mock_generator = MagicMock()
+        # autospec validates the generate_concepts call signature against
+        # the real method, so drift would fail here instead of in prod
+        mock_generator = mock_generator_class.return_value
         mock_generator.generate_concepts.return_value = {
             "topic": "Test Topic",
             "location": "Test Location",
@@ -291,7 +236,6 @@ class TestConvenienceFunctions:
             "ranking": [],
             "winner": ""
         }
-        mock_generator_class.return_value = mock_generator
 
         news_data = {
             'dominant_topic': 'Test Topic',
@@ -311,10 +255,10 @@ class TestConvenienceFunctions:
             []
         )
 
-    @patch('src.cartoon_generator.CartoonGenerator')
+    @patch('src.cartoon_generator.CartoonGenerator', autospec=True)
     def test_generate_cartoons_from_news_missing_data(self, mock_generator_class):
         """Test generating cartoons with missing news data."""
-        mock_generator = MagicMock()
+        mock_generator = mock_generator_class.return_value
         mock_generator.generate_concepts.return_value = {
             "topic": "General News",
             "location": "Unknown",
@@ -322,7 +266,6 @@ class TestConvenienceFunctions:
             "ranking": [],
             "winner": ""
         }
-        mock_generator_class.return_value = mock_generator
 
         news_data = {}
 
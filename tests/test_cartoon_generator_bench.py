@@ -0,0 +1,50 @@
+"""Micro-benchmarks for the hot Gemini response-parsing paths.
+
+Disabled by default (pytest.ini passes --benchmark-disable, which runs each
+case once as a plain test). To measure:
+
+    pytest tests/test_cartoon_generator_bench.py -n0 --benchmark-enable
+
+Save a baseline with --benchmark-save=baseline and guard regressions with
+--benchmark-compare-fail=mean:10%.
+"""
+
+import pytest
+from unittest.mock import patch, DEFAULT
+
+from src.cartoon_generator import CartoonGenerator
+from tests.test_cartoon_generator import VALID_RESPONSE_JSON
+
+
+@pytest.fixture
+def generator():
+    """CartoonGenerator with the SDK mocked out, as in the unit tests."""
+    with patch.multiple(
+        'src.cartoon_generator', get_api_key=DEFAULT, genai=DEFAULT
+    ) as mocks:
+        mocks['get_api_key'].return_value = "test-key"
+        yield CartoonGenerator()
+
+
+def test_parse_response_bench(benchmark, generator):
+    """Benchmark the JSON parse + validation path on a well-formed payload."""
+    result = benchmark(
+        generator._parse_response,
+        VALID_RESPONSE_JSON, "Local Politics", "Melbourne, Australia"
+    )
+    assert len(result['ideas']) == 5
+
+
+def test_fix_cartoon_data_bench(benchmark, generator):
+    """Benchmark structure repair on a partially populated payload."""
+    partial = {
+        "topic": "Test",
+        "location": "Test Location",
+        "ideas": [{"title": "Only One"}],
+        "ranking": []
+    }
+    result = benchmark(
+        generator._fix_cartoon_data, dict(partial), "Test", "Test Location"
+    )
+    assert len(result['ideas']) == 5
+    assert len(result['ranking']) == 5
@@ -1,42 +1,96 @@
 """Tests for image generation functionality."""
 
+import copy
+
 import pytest
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, MagicMock, Mock, DEFAULT
 from pathlib import Path
-from PIL import Image
 from src.image_generator import ImageGenerator, generate_cartoon_image_from_data
 
+# Spec'ing a MagicMock against Image.Image introspects the whole PIL class;
+# built once on first use (PIL itself is imported lazily, inside the tests
+# that actually touch it) and copied cheaply after that
+_IMAGE_MOCK_PROTOTYPE = None
+
+
+@pytest.fixture
+def mock_image():
+    """Spec'd stand-in for a generated PIL image.
+
+    Copied from a lazily built prototype; reset so call records from
+    other copies (the children are shared) never leak between tests.
+    """
+    global _IMAGE_MOCK_PROTOTYPE
+    if _IMAGE_MOCK_PROTOTYPE is None:
+        from PIL import Image
+        _IMAGE_MOCK_PROTOTYPE = MagicMock(spec=Image.Image)
+    image = copy.copy(_IMAGE_MOCK_PROTOTYPE)
+    image.reset_mock()
+    return image
+
+
+@pytest.fixture(scope='module')
+def winner_cartoon_data():
+    """Cartoon payload whose winner appears in ideas.
+
+    Module-scoped: generate_and_save only reads it, so the same dict
+    serves every test that needs a well-formed winner.
+    """
+    return {
+        'topic': 'Test Topic',
+        'location': 'Melbourne, Australia',
+        'ideas': [
+            {
+                'title': 'Winner Cartoon',
+                'premise': 'Funny premise',
+                'why_funny': 'Very funny'
+            }
+        ],
+        'ranking': ['Winner Cartoon'],
+        'winner': 'Winner Cartoon'
+    }
+
 
 class TestImageGenerator:
     """Tests for ImageGenerator class."""
 
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
-    def test_init_with_api_key(self, mock_model, mock_configure, mock_get_key):
-        """Test ImageGenerator initialization with API key."""
-        generator = ImageGenerator(api_key="test-key")
-        assert generator.api_key == "test-key"
-        mock_configure.assert_called_once_with(api_key="test-key")
-
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
-    def test_init_without_api_key(self, mock_model, mock_configure, mock_get_key):
-        """Test ImageGenerator initialization without API key."""
-        mock_get_key.return_value = "fetched-key"
-        generator = ImageGenerator()
-        assert generator.api_key == "fetched-key"
-        mock_configure.assert_called_once_with(api_key="fetched-key")
-
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
-    def test_build_image_prompt(self, mock_model, mock_configure, mock_get_key):
+    @pytest.fixture(autouse=True)
+    def gemini_mocks(self):
+        """Mock get_api_key and the genai SDK once for every test.
+
+        Replaces the triple @patch stack each test used to carry; yields
+        the mock namespace so tests can tune model behavior as needed.
+        """
+        with patch.multiple(
+            'src.image_generator', get_api_key=DEFAULT, genai=DEFAULT
+        ) as mocks:
+            mocks['get_api_key'].return_value = "test-key"
+            yield mocks
+
+    @pytest.fixture
+    def generator(self, gemini_mocks):
+        """ImageGenerator built against the mocked SDK.
+
+        Construction is all mock calls, so tests that don't assert on
+        init behavior share this instead of building their own.
+        """
+        return ImageGenerator()
+
+    @pytest.mark.parametrize("api_key,expected", [
+        ("test-key", "test-key"),
+        (None, "fetched-key"),
+    ], ids=["explicit", "fetched"])
+    def test_init_api_key_resolution(self, gemini_mocks, api_key, expected):
+        """Test that init uses an explicit key or falls back to get_api_key."""
+        gemini_mocks['get_api_key'].return_value = "fetched-key"
+
+        generator = ImageGenerator(api_key=api_key)
+
+        assert generator.api_key == expected
+        gemini_mocks['genai'].configure.assert_called_once_with(api_key=expected)
+
+    def test_build_image_prompt(self, generator):
         """Test image prompt building."""
-        mock_get_key.return_value = "test-key"
-
-        generator = ImageGenerator()
         prompt = generator._build_image_prompt(
             "Test Cartoon",
             "A funny premise",
@@ -50,89 +104,45 @@ class TestImageGenerator:
         assert "newspaper comic strip" in prompt
         assert "Art style requirements" in prompt
 
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
-    def test_create_placeholder_image(self, mock_model, mock_configure, mock_get_key):
-        """Test placeholder image creation."""
-        mock_get_key.return_value = "test-key"
+    @pytest.mark.parametrize("size_args", [(800, 600), ()],
+                             ids=["explicit-size", "default-size"])
+    def test_create_placeholder_image(self, generator, size_args):
+        """Test placeholder creation with explicit and default dimensions."""
+        from PIL import Image
 
-        generator = ImageGenerator()
         image = generator.create_placeholder_image(
             "Test Title",
             "This is a test premise for a cartoon",
-            800,
-            600
+            *size_args
         )
 
         assert isinstance(image, Image.Image)
         assert image.size == (800, 600)
         assert image.mode == 'RGB'
 
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
-    def test_create_placeholder_image_default_size(self, mock_model, mock_configure, mock_get_key):
-        """Test placeholder image with default dimensions."""
-        mock_get_key.return_value = "test-key"
-
-        generator = ImageGenerator()
-        image = generator.create_placeholder_image("Title", "Premise")
-
-        assert isinstance(image, Image.Image)
-        assert image.size == (800, 600)
-
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
-    def test_save_image(self, mock_model, mock_configure, mock_get_key, tmp_path):
-        """Test image saving."""
-        mock_get_key.return_value = "test-key"
-
-        generator = ImageGenerator()
-        image = Image.new('RGB', (100, 100), color='white')
-
+    def test_save_image(self, generator, mock_image, tmp_path):
+        """Test image saving without touching the filesystem."""
         cartoon_data = {
             'location': 'Melbourne, Australia',
             'winner': 'Test Cartoon'
         }
 
-        with patch('src.image_generator.Path') as mock_path_class:
-            mock_path = MagicMock()
-            mock_path.__truediv__ = lambda self, other: tmp_path / other
-            mock_path.mkdir = MagicMock()
-            mock_path_class.return_value = mock_path
-
-            # Create actual file in tmp_path
-            output_path = tmp_path / "test.png"
-            image.save(output_path)
-
-            result = generator.save_image(image, cartoon_data, tmp_path)
+        result = generator.save_image(mock_image, cartoon_data, tmp_path)
 
-            assert result is not None
-            assert isinstance(result, Path)
+        assert isinstance(result, Path)
+        assert result.parent == tmp_path
+        assert result.suffix == '.png'
+        mock_image.save.assert_called_once_with(result, format='PNG', quality=95)
 
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
-    def test_generate_cartoon_image_no_image_support(
-        self,
-        mock_model_class,
-        mock_configure,
-        mock_get_key
-    ):
+    def test_generate_cartoon_image_no_image_support(self, generator, gemini_mocks):
         """Test cartoon generation when image generation not supported."""
-        mock_get_key.return_value = "test-key"
-
-        mock_model = MagicMock()
         mock_response = MagicMock()
         mock_response.text = "Image description"
         # No image attribute
         del mock_response.image
-        mock_model.generate_content.return_value = mock_response
-        mock_model_class.return_value = mock_model
+        model = gemini_mocks['genai'].GenerativeModel.return_value
+        model.generate_content.return_value = mock_response
 
-        generator = ImageGenerator()
         result = generator.generate_cartoon_image(
             "Test Title",
             "Test Premise",
@@ -141,23 +151,11 @@ class TestImageGenerator:
 
         assert result is None
 
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
-    def test_generate_cartoon_image_error(
-        self,
-        mock_model_class,
-        mock_configure,
-        mock_get_key
-    ):
+    def test_generate_cartoon_image_error(self, generator, gemini_mocks):
         """Test cartoon generation with error."""
-        mock_get_key.return_value = "test-key"
-
-        mock_model = MagicMock()
-        mock_model.generate_content.side_effect = Exception("API Error")
-        mock_model_class.return_value = mock_model
+        model = gemini_mocks['genai'].GenerativeModel.return_value
+        model.generate_content.side_effect = Exception("API Error")
 
-        generator = ImageGenerator()
         result = generator.generate_cartoon_image(
             "Test Title",
             "Test Premise",
@@ -168,40 +166,19 @@ class TestImageGenerator:
 
     @patch.object(ImageGenerator, 'create_placeholder_image')
     @patch.object(ImageGenerator, 'save_image')
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
     def test_generate_and_save_with_placeholder(
         self,
-        mock_model,
-        mock_configure,
-        mock_get_key,
         mock_save,
-        mock_placeholder
+        mock_placeholder,
+        generator,
+        mock_image,
+        winner_cartoon_data
     ):
         """Test generate_and_save with placeholder mode."""
-        mock_get_key.return_value = "test-key"
-
-        cartoon_data = {
-            'topic': 'Test Topic',
-            'location': 'Melbourne, Australia',
-            'ideas': [
-                {
-                    'title': 'Winner Cartoon',
-                    'premise': 'Funny premise',
-                    'why_funny': 'Very funny'
-                }
-            ],
-            'ranking': ['Winner Cartoon'],
-            'winner': 'Winner Cartoon'
-        }
-
-        mock_image = MagicMock(spec=Image.Image)
         mock_placeholder.return_value = mock_image
         mock_save.return_value = Path('/fake/path/image.png')
 
-        generator = ImageGenerator()
-        result = generator.generate_and_save(cartoon_data, use_placeholder=True)
+        result = generator.generate_and_save(winner_cartoon_data, use_placeholder=True)
 
         assert result == Path('/fake/path/image.png')
         mock_placeholder.assert_called_once_with('Winner Cartoon', 'Funny premise')
@@ -210,21 +187,14 @@ class TestImageGenerator:
     @patch.object(ImageGenerator, 'generate_cartoon_image')
     @patch.object(ImageGenerator, 'create_placeholder_image')
     @patch.object(ImageGenerator, 'save_image')
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
     def test_generate_and_save_no_winner_found(
         self,
-        mock_model,
-        mock_configure,
-        mock_get_key,
         mock_save,
         mock_placeholder,
-        mock_generate
+        mock_generate,
+        generator
     ):
         """Test generate_and_save when winner not found in ideas."""
-        mock_get_key.return_value = "test-key"
-
         cartoon_data = {
             'topic': 'Test Topic',
             'location': 'Melbourne, Australia',
@@ -239,7 +209,6 @@ class TestImageGenerator:
             'winner': 'Winner Cartoon'  # Not in ideas
         }
 
-        generator = ImageGenerator()
         result = generator.generate_and_save(cartoon_data)
 
         assert result is None
@@ -247,42 +216,21 @@ class TestImageGenerator:
     @patch.object(ImageGenerator, 'generate_cartoon_image')
     @patch.object(ImageGenerator, 'create_placeholder_image')
     @patch.object(ImageGenerator, 'save_image')
-    @patch('src.image_generator.get_api_key')
-    @patch('src.image_generator.genai.configure')
-    @patch('src.image_generator.genai.GenerativeModel')
     def test_generate_and_save_fallback_to_placeholder(
         self,
-        mock_model,
-        mock_configure,
-        mock_get_key,
         mock_save,
         mock_placeholder,
-        mock_generate
+        mock_generate,
+        generator,
+        mock_image,
+        winner_cartoon_data
     ):
         """Test generate_and_save falls back to placeholder when generation fails."""
-        mock_get_key.return_value = "test-key"
-
-        cartoon_data = {
-            'topic': 'Test Topic',
-            'location': 'Melbourne, Australia',
-            'ideas': [
-                {
-                    'title': 'Winner Cartoon',
-                    'premise': 'Funny premise',
-                    'why_funny': 'Very funny'
-                }
-            ],
-            'ranking': ['Winner Cartoon'],
-            'winner': 'Winner Cartoon'
-        }
-
         mock_generate.return_value = None  # Generation fails
-        mock_image = MagicMock(spec=Image.Image)
         mock_placeholder.return_value = mock_image
         mock_save.return_value = Path('/fake/path/image.png')
 
-        generator = ImageGenerator()
-        result = generator.generate_and_save(cartoon_data, use_placeholder=False)
+        result = generator.generate_and_save(winner_cartoon_data, use_placeholder=False)
 
         assert result == Path('/fake/path/image.png')
         mock_generate.assert_called_once()
@@ -292,13 +240,22 @@ class TestImageGenerator:
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
-    @patch('src.image_generator.ImageGenerator')
-    def test_generate_cartoon_image_from_data(self, mock_generator_class):
-        """Test generate_cartoon_image_from_data convenience function."""
-        mock_generator = MagicMock()
-        mock_generator.generate_and_save.return_value = Path('/fake/path/image.png')
-        mock_generator_class.return_value = mock_generator
+    @pytest.fixture
+    def generator_class(self, monkeypatch):
+        """Swap the ImageGenerator class for a mock via monkeypatch.
+
+        Cheaper than spinning up a patcher object per test, and undone
+        automatically by the fixture's teardown.
+        """
+        mock_class = MagicMock()
+        mock_class.return_value.generate_and_save.return_value = (
+            Path('/fake/path/image.png')
+        )
+        monkeypatch.setattr('src.image_generator.ImageGenerator', mock_class)
+        return mock_class
 
+    def test_generate_cartoon_image_from_data(self, generator_class):
+        """Test generate_cartoon_image_from_data convenience function."""
         cartoon_data = {
             'topic': 'Test',
             'location': 'Test Location',
@@ -313,24 +270,19 @@ class TestConvenienceFunctions:
         )
 
         assert result == Path('/fake/path/image.png')
-        mock_generator_class.assert_called_once_with(api_key="test-key")
-        mock_generator.generate_and_save.assert_called_once_with(
+        generator_class.assert_called_once_with(api_key="test-key")
+        generator_class.return_value.generate_and_save.assert_called_once_with(
             cartoon_data,
             True
         )
 
-    @patch('src.image_generator.ImageGenerator')
-    def test_generate_cartoon_image_from_data_no_placeholder(self, mock_generator_class):
+    def test_generate_cartoon_image_from_data_no_placeholder(self, generator_class):
         """Test generating image without placeholder mode."""
-        mock_generator = MagicMock()
-        mock_generator.generate_and_save.return_value = Path('/fake/path/image.png')
-        mock_generator_class.return_value = mock_generator
-
         cartoon_data = {'ideas': [], 'winner': 'Test'}
 
         result = generate_cartoon_image_from_data(cartoon_data)
 
-        mock_generator.generate_and_save.assert_called_once_with(
+        generator_class.return_value.generate_and_save.assert_called_once_with(
             cartoon_data,
             False
         )
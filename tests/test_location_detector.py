@@ -1,20 +1,36 @@
 """Tests for location detection functionality."""
 
 import pytest
-from unittest.mock import patch, MagicMock, Mock
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, Mock, DEFAULT
 from src.location_detector import LocationDetector, get_current_location
 
 
 class TestLocationDetector:
     """Tests for LocationDetector class."""
 
-    def test_init(self):
+    @pytest.fixture(scope='class')
+    def detector(self):
+        """One LocationDetector shared across the class.
+
+        A MagicMock geolocator is injected so no Nominatim client is ever
+        built and tests stub .geocode/.reverse directly instead of opening
+        a patch.object context per call.
+        """
+        return LocationDetector(geolocator=MagicMock())
+
+    @pytest.fixture(autouse=True)
+    def _reset_geolocator(self, detector):
+        """Clear stubbed return values and side effects between tests."""
+        yield
+        detector.geolocator.reset_mock(return_value=True, side_effect=True)
+
+    def test_init(self, detector):
         """Test LocationDetector initialization."""
-        detector = LocationDetector()
         assert detector.geolocator is not None
 
     @patch('streamlit_js_eval.get_geolocation')
-    def test_get_browser_location_success(self, mock_geolocation):
+    def test_get_browser_location_success(self, mock_geolocation, detector):
         """Test successful browser location retrieval."""
         mock_geolocation.return_value = {
             'coords': {
@@ -24,7 +40,6 @@ class TestLocationDetector:
             }
         }
 
-        detector = LocationDetector()
         result = detector.get_browser_location()
 
         assert result is not None
@@ -33,26 +48,24 @@ class TestLocationDetector:
         assert result['source'] == 'browser'
 
     @patch('streamlit_js_eval.get_geolocation')
-    def test_get_browser_location_failure(self, mock_geolocation):
+    def test_get_browser_location_failure(self, mock_geolocation, detector):
         """Test browser location retrieval failure."""
         mock_geolocation.return_value = None
 
-        detector = LocationDetector()
         result = detector.get_browser_location()
 
         assert result is None
 
     @patch('src.location_detector.geocoder')
-    def test_get_ip_location_success(self, mock_geocoder):
+    def test_get_ip_location_success(self, mock_geocoder, detector):
         """Test successful IP-based location retrieval."""
-        mock_location = MagicMock()
-        mock_location.ok = True
-        mock_location.latlng = [-37.8136, 144.9631]
-        mock_location.city = "Melbourne"
-        mock_location.country = "Australia"
-        mock_geocoder.ip.return_value = mock_location
-
-        detector = LocationDetector()
+        mock_geocoder.ip.return_value = SimpleNamespace(
+            ok=True,
+            latlng=[-37.8136, 144.9631],
+            city="Melbourne",
+            country="Australia"
+        )
+
         result = detector.get_ip_location()
 
         assert result is not None
@@ -63,225 +76,147 @@ class TestLocationDetector:
         assert result['source'] == 'ip'
 
     @patch('src.location_detector.geocoder')
-    def test_get_ip_location_failure(self, mock_geocoder):
+    def test_get_ip_location_failure(self, mock_geocoder, detector):
         """Test IP location retrieval failure."""
-        mock_location = MagicMock()
-        mock_location.ok = False
-        mock_geocoder.ip.return_value = mock_location
+        mock_geocoder.ip.return_value = SimpleNamespace(ok=False, latlng=None)
 
-        detector = LocationDetector()
         result = detector.get_ip_location()
 
         assert result is None
 
-    def test_reverse_geocode_success(self):
+    def test_reverse_geocode_success(self, detector):
         """Test successful reverse geocoding."""
-        detector = LocationDetector()
-
-        mock_location = MagicMock()
-        mock_location.address = "Melbourne, Victoria, Australia"
-        mock_location.raw = {
-            'address': {
-                'city': 'Melbourne',
-                'state': 'Victoria',
-                'country': 'Australia',
-                'country_code': 'au'
+        mock_location = SimpleNamespace(
+            address="Melbourne, Victoria, Australia",
+            raw={
+                'address': {
+                    'city': 'Melbourne',
+                    'state': 'Victoria',
+                    'country': 'Australia',
+                    'country_code': 'au'
+                }
             }
-        }
+        )
 
-        with patch.object(detector.geolocator, 'reverse', return_value=mock_location):
-            result = detector.reverse_geocode(-37.8136, 144.9631)
+        detector.geolocator.reverse.return_value = mock_location
+        result = detector.reverse_geocode(-37.8136, 144.9631)
 
-            assert result is not None
-            assert result['city'] == 'Melbourne'
-            assert result['state'] == 'Victoria'
-            assert result['country'] == 'Australia'
-            assert result['country_code'] == 'AU'
+        assert result is not None
+        assert result['city'] == 'Melbourne'
+        assert result['state'] == 'Victoria'
+        assert result['country'] == 'Australia'
+        assert result['country_code'] == 'AU'
 
-    def test_reverse_geocode_with_town(self):
+    def test_reverse_geocode_with_town(self, detector):
         """Test reverse geocoding returns town when city not available."""
-        detector = LocationDetector()
-
-        mock_location = MagicMock()
-        mock_location.address = "Small Town, Victoria, Australia"
-        mock_location.raw = {
-            'address': {
-                'town': 'Small Town',
-                'state': 'Victoria',
-                'country': 'Australia',
-                'country_code': 'au'
+        mock_location = SimpleNamespace(
+            address="Small Town, Victoria, Australia",
+            raw={
+                'address': {
+                    'town': 'Small Town',
+                    'state': 'Victoria',
+                    'country': 'Australia',
+                    'country_code': 'au'
+                }
             }
-        }
+        )
 
-        with patch.object(detector.geolocator, 'reverse', return_value=mock_location):
-            result = detector.reverse_geocode(-37.8136, 144.9631)
+        detector.geolocator.reverse.return_value = mock_location
+        result = detector.reverse_geocode(-37.8136, 144.9631)
 
-            assert result is not None
-            assert result['city'] == 'Small Town'
+        assert result is not None
+        assert result['city'] == 'Small Town'
 
-    def test_reverse_geocode_failure(self):
+    def test_reverse_geocode_failure(self, detector):
         """Test reverse geocoding failure."""
-        detector = LocationDetector()
-
-        with patch.object(detector.geolocator, 'reverse', side_effect=Exception("Error")):
-            result = detector.reverse_geocode(-37.8136, 144.9631)
+        detector.geolocator.reverse.side_effect = Exception("Error")
+        result = detector.reverse_geocode(-37.8136, 144.9631)
 
-            assert result is None
+        assert result is None
 
-    def test_parse_manual_location_success(self):
+    def test_parse_manual_location_success(self, detector):
         """Test successful manual location parsing."""
-        detector = LocationDetector()
-
-        mock_location = MagicMock()
-        mock_location.latitude = 48.8566
-        mock_location.longitude = 2.3522
-        mock_location.address = "Paris, France"
-
-        with patch.object(detector.geolocator, 'geocode', return_value=mock_location):
-            result = detector.parse_manual_location("Paris, France")
-
-            assert result is not None
-            assert result['latitude'] == 48.8566
-            assert result['longitude'] == 2.3522
-            assert result['source'] == 'manual'
-
-    def test_parse_manual_location_failure(self):
-        """Test manual location parsing failure."""
-        detector = LocationDetector()
-
-        with patch.object(detector.geolocator, 'geocode', return_value=None):
-            result = detector.parse_manual_location("Invalid Location XYZ123")
-
-            assert result is None
-
-    def test_format_location_display_full(self):
-        """Test location formatting with all components."""
-        detector = LocationDetector()
-
-        address = {
-            'city': 'Melbourne',
-            'state': 'Victoria',
-            'country': 'Australia'
-        }
-
-        result = detector.format_location_display(address)
-        assert result == 'Melbourne, Victoria, Australia'
-
-    def test_format_location_display_partial(self):
-        """Test location formatting with missing components."""
-        detector = LocationDetector()
-
-        address = {
-            'city': 'Melbourne',
-            'country': 'Australia'
-        }
-
-        result = detector.format_location_display(address)
-        assert result == 'Melbourne, Australia'
-
-    def test_format_location_display_empty(self):
-        """Test location formatting with empty address."""
-        detector = LocationDetector()
-
-        address = {}
-
-        result = detector.format_location_display(address)
-        assert result == 'Unknown Location'
-
-    @patch.object(LocationDetector, 'parse_manual_location')
-    @patch.object(LocationDetector, 'reverse_geocode')
-    def test_get_location_with_fallback_manual(
-        self,
-        mock_reverse,
-        mock_parse
-    ):
-        """Test location fallback with manual entry."""
-        mock_parse.return_value = {
-            'latitude': 48.8566,
-            'longitude': 2.3522,
-            'source': 'manual'
-        }
-        mock_reverse.return_value = {
-            'city': 'Paris',
-            'country': 'France'
-        }
-
-        detector = LocationDetector()
-        result = detector.get_location_with_fallback("Paris, France")
-
-        assert result is not None
-        coords, address = result
-        assert coords['latitude'] == 48.8566
-        assert address['city'] == 'Paris'
-
-    @patch.object(LocationDetector, 'get_browser_location')
-    @patch.object(LocationDetector, 'reverse_geocode')
-    def test_get_location_with_fallback_browser(
-        self,
-        mock_reverse,
-        mock_browser
-    ):
-        """Test location fallback with browser geolocation."""
-        mock_browser.return_value = {
-            'latitude': -37.8136,
-            'longitude': 144.9631,
-            'source': 'browser'
-        }
-        mock_reverse.return_value = {
-            'city': 'Melbourne',
-            'country': 'Australia'
-        }
+        mock_location = SimpleNamespace(
+            latitude=48.8566,
+            longitude=2.3522,
+            address="Paris, France"
+        )
 
-        detector = LocationDetector()
-        result = detector.get_location_with_fallback()
+        detector.geolocator.geocode.return_value = mock_location
+        result = detector.parse_manual_location("Paris, France")
 
         assert result is not None
-        coords, address = result
-        assert coords['latitude'] == -37.8136
-        assert address['city'] == 'Melbourne'
-
-    @patch.object(LocationDetector, 'get_browser_location')
-    @patch.object(LocationDetector, 'get_ip_location')
-    @patch.object(LocationDetector, 'reverse_geocode')
-    def test_get_location_with_fallback_ip(
-        self,
-        mock_reverse,
-        mock_ip,
-        mock_browser
-    ):
-        """Test location fallback with IP geolocation."""
-        mock_browser.return_value = None
-        mock_ip.return_value = {
-            'latitude': -37.8136,
-            'longitude': 144.9631,
-            'city': 'Melbourne',
-            'country': 'Australia',
-            'source': 'ip'
-        }
-        mock_reverse.return_value = None  # Not needed for IP with city
+        assert result['latitude'] == 48.8566
+        assert result['longitude'] == 2.3522
+        assert result['source'] == 'manual'
 
-        detector = LocationDetector()
-        result = detector.get_location_with_fallback()
+    def test_parse_manual_location_failure(self, detector):
+        """Test manual location parsing failure."""
+        detector.geolocator.geocode.return_value = None
+        result = detector.parse_manual_location("Invalid Location XYZ123")
 
-        assert result is not None
-        coords, address = result
-        assert address['city'] == 'Melbourne'
+        assert result is None
 
-    @patch.object(LocationDetector, 'get_browser_location')
-    @patch.object(LocationDetector, 'get_ip_location')
-    def test_get_location_with_fallback_all_fail(
-        self,
-        mock_ip,
-        mock_browser
+    @pytest.mark.parametrize("address,expected", [
+        ({'city': 'Melbourne', 'state': 'Victoria', 'country': 'Australia'},
+         'Melbourne, Victoria, Australia'),
+        ({'city': 'Melbourne', 'country': 'Australia'},
+         'Melbourne, Australia'),
+        ({}, 'Unknown Location'),
+    ], ids=["full", "partial", "empty"])
+    def test_format_location_display(self, detector, address, expected):
+        """Test location formatting with full, partial and empty addresses."""
+        assert detector.format_location_display(address) == expected
+
+    @pytest.mark.parametrize("manual_location,returns,expected", [
+        pytest.param(
+            "Paris, France",
+            {'parse_manual_location': {'latitude': 48.8566, 'longitude': 2.3522,
+                                       'source': 'manual'},
+             'reverse_geocode': {'city': 'Paris', 'country': 'France'}},
+            (48.8566, 'Paris'),
+            id="manual"),
+        pytest.param(
+            None,
+            {'get_browser_location': {'latitude': -37.8136, 'longitude': 144.9631,
+                                      'source': 'browser'},
+             'reverse_geocode': {'city': 'Melbourne', 'country': 'Australia'}},
+            (-37.8136, 'Melbourne'),
+            id="browser"),
+        pytest.param(
+            None,
+            # IP result already carries city info, so reverse_geocode stays None
+            {'get_ip_location': {'latitude': -37.8136, 'longitude': 144.9631,
+                                 'city': 'Melbourne', 'country': 'Australia',
+                                 'source': 'ip'}},
+            (-37.8136, 'Melbourne'),
+            id="ip"),
+        pytest.param(None, {}, None, id="all_fail"),
+    ])
+    def test_get_location_with_fallback(
+        self, detector, manual_location, returns, expected
     ):
-        """Test location fallback when all methods fail."""
-        mock_browser.return_value = None
-        mock_ip.return_value = None
-
-        detector = LocationDetector()
-        result = detector.get_location_with_fallback()
-
-        assert result is None
+        """Test each tier of the manual → browser → IP fallback chain."""
+        with patch.multiple(
+            LocationDetector,
+            parse_manual_location=DEFAULT,
+            get_browser_location=DEFAULT,
+            get_ip_location=DEFAULT,
+            reverse_geocode=DEFAULT,
+        ) as mocks:
+            # Unlisted tiers return None so the chain falls through them
+            for name, mock in mocks.items():
+                mock.return_value = returns.get(name)
+
+            result = detector.get_location_with_fallback(manual_location)
+
+        if expected is None:
+            assert result is None
+        else:
+            latitude, city = expected
+            coords, address = result
+            assert coords['latitude'] == latitude
+            assert address['city'] == city
 
 
 class TestConvenienceFunctions:
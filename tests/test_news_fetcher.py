@@ -1,10 +1,161 @@
 """Tests for news fetching functionality."""
 
+import jsonschema
 import pytest
 from unittest.mock import patch, MagicMock, Mock
 from datetime import datetime
 from src.news_fetcher import NewsFetcher, fetch_news_for_location
 
+# Shape of a displayable headline; compiled once at import so the
+# display-format test runs a single validator traversal per headline
+_HEADLINE_SCHEMA = {
+    "type": "object",
+    "required": ["title", "summary", "url", "source"],
+    "properties": {
+        "title": {"type": "string", "minLength": 1},
+        "summary": {"type": "string", "minLength": 1},
+        "url": {"type": "string", "minLength": 1},
+        "source": {"type": "string", "minLength": 1},
+    },
+}
+_HEADLINE_VALIDATOR = jsonschema.Draft7Validator(_HEADLINE_SCHEMA)
+
+
+class _FakeResp:
+    """Slotted stand-in for a requests.Response.
+
+    Cheaper than SimpleNamespace or any Mock variant: slot lookups skip
+    the instance __dict__ entirely, and the tests only ever touch
+    .status_code and .json().
+    """
+
+    __slots__ = ('status_code', '_json')
+
+    def __init__(self, status_code=200, json=None):
+        self.status_code = status_code
+        self._json = json
+
+    def json(self):
+        return self._json
+
+
+@pytest.fixture
+def fetcher():
+    """Pre-built NewsFetcher shared by tests that don't exercise init.
+
+    Function-scoped rather than module-scoped: construction binds the
+    per-test isolated news cache directory, and tests that patch GNews
+    still build their own instance inside the patch.
+    """
+    return NewsFetcher(api_key="test-key")
+
+
+def _fetch_melbourne(fetcher, *args, **kwargs):
+    """Fetch for the canonical Melbourne, Australia test location."""
+    return fetcher.fetch_local_news("Melbourne", "Australia", *args, **kwargs)
+
+
+# Canonical article payloads, built once at import instead of inline per
+# test so reruns and future parametrization don't reconstruct them
+_SUCCESS_ARTICLES = [
+    {
+        "title": "Local Event in Melbourne",
+        "description": "Something happened in the city of Melbourne"
+    },
+    {
+        "title": "Melbourne City News - Government Announcement",
+        "description": "More news from the Melbourne municipality"
+    },
+    {
+        "title": "City News - Government Announcement",
+        "description": "Unrelated global news that should be filtered out"
+    }
+]
+
+_DEFAULT_DATE_ARTICLES = [
+    {
+        "title": "Paris News",
+        "description": "French capital news"
+    }
+]
+
+# Shared by every article in the mixed-location payload; NewsFetcher only
+# reads the publisher title, so one dict can back all four entries
+_PUBLISHER_NEWS = {"title": "News"}
+
+# Mix of Melbourne and non-Melbourne stories for the filtering test:
+# location in title, location only in description, and unrelated cities
+_GNEWS_MIXED_LOCATION_ARTICLES = [
+    {
+        "title": "Tokyo launches new subway line",
+        "description": "Japanese capital opens transportation",
+        "url": "https://news.example.com/tokyo-1",
+        "publisher": _PUBLISHER_NEWS
+    },
+    {
+        "title": "Melbourne weather update",
+        "description": "Local conditions report",
+        "url": "https://news.example.com/melbourne-weather",
+        "publisher": _PUBLISHER_NEWS
+    },
+    {
+        "title": "Technology trends",
+        "description": "New developments in Melbourne technology sector",
+        "url": "https://news.example.com/tech-1",
+        "publisher": _PUBLISHER_NEWS
+    },
+    {
+        "title": "Melbourne's famous landmarks attract tourists",
+        "description": "Popular destinations worldwide",
+        "url": "https://news.example.com/landmarks",
+        "publisher": _PUBLISHER_NEWS
+    }
+]
+
+# Canonical fetch_news_for_location payload; each test reads a few keys,
+# so one module-level dict (copied per test) serves every scenario
+_FETCH_NEWS_RESULT = {
+    'news_data': {},
+    'dominant_topic': 'Test Topic',
+    'summary': 'Test summary',
+    'location': 'Test City, Test Country',
+    'date': '2025-11-03',
+    'sort_by': 'popularity',
+}
+
+_GNEWS_MELBOURNE_ARTICLES = [
+    {
+        "title": "Melbourne heatwave causes traffic chaos on main roads",
+        "description": "Extreme temperatures in Melbourne caused significant traffic disruptions today",
+        "url": "https://news.example.com/melbourne-heat-1",
+        "publisher": {"title": "News Today"}
+    },
+    {
+        "title": "Melbourne startup raises funding milestone",
+        "description": "A Melbourne-based tech company announced record funding round",
+        "url": "https://news.example.com/melbourne-startup",
+        "publisher": {"title": "Tech News"}
+    },
+    {
+        "title": "Melbourne arts festival announces 2025 program",
+        "description": "The annual Melbourne arts festival has revealed its diverse lineup",
+        "url": "https://news.example.com/melbourne-arts",
+        "publisher": {"title": "Arts Weekly"}
+    },
+    {
+        "title": "New bike lanes open in Melbourne CBD",
+        "description": "City council completed expansion of bicycle infrastructure in Melbourne",
+        "url": "https://news.example.com/melbourne-bikes",
+        "publisher": {"title": "City News"}
+    },
+    {
+        "title": "Melbourne weather: Summer forecast looks intense",
+        "description": "Meteorologists predict Melbourne will experience hot and dry summer conditions",
+        "url": "https://news.example.com/melbourne-weather",
+        "publisher": {"title": "Weather Hub"}
+    }
+]
+
 
 class TestNewsFetcher:
     """Tests for NewsFetcher class."""
@@ -15,44 +166,26 @@ class TestNewsFetcher:
         assert fetcher.api_key == "test-key"
         assert fetcher.base_url == "https://newsapi.org/v2"
 
-    @patch.dict('os.environ', {'NEWSAPI_KEY': 'env-key'})
-    def test_init_without_api_key_uses_env(self):
+    def test_init_without_api_key_uses_env(self, monkeypatch):
         """Test NewsFetcher initialization without API key uses environment variable."""
+        monkeypatch.setenv('NEWSAPI_KEY', 'env-key')
         fetcher = NewsFetcher()
         assert fetcher.api_key == "env-key"
 
-    def test_init_without_api_key_no_env(self):
+    def test_init_without_api_key_no_env(self, monkeypatch):
         """Test NewsFetcher initialization without API key and no environment variable."""
-        with patch.dict('os.environ', {}, clear=True):
-            fetcher = NewsFetcher()
-            assert fetcher.api_key is None
+        monkeypatch.delenv('NEWSAPI_KEY', raising=False)
+        fetcher = NewsFetcher()
+        assert fetcher.api_key is None
 
     @patch('src.news_fetcher.requests.get')
     def test_fetch_local_news_success(self, mock_get):
         """Test successful news fetching from NewsAPI."""
         # Mock the requests.get response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "articles": [
-                {
-                    "title": "Local Event in Melbourne",
-                    "description": "Something happened in the city of Melbourne"
-                },
-                {
-                    "title": "Melbourne City News - Government Announcement",
-                    "description": "More news from the Melbourne municipality"
-                },
-                {
-                    "title": "City News - Government Announcement",
-                    "description": "Unrelated global news that should be filtered out"
-                }
-            ]
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = _FakeResp(200, {"articles": _SUCCESS_ARTICLES})
 
         fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news("Melbourne", "Australia", "2025-11-03", num_headlines=2)
+        result = _fetch_melbourne(fetcher, "2025-11-03", num_headlines=2)
 
         assert result['location'] == "Melbourne, Australia"
         assert result['date'] == "2025-11-03"
@@ -63,76 +196,92 @@ class TestNewsFetcher:
     @patch('src.news_fetcher.requests.get')
     def test_fetch_local_news_with_default_date(self, mock_get):
         """Test news fetching with default date."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "articles": [
-                {
-                    "title": "Paris News",
-                    "description": "French capital news"
-                }
-            ]
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = _FakeResp(200, {"articles": _DEFAULT_DATE_ARTICLES})
 
-        fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news("Paris", "France")
+        # Freeze the clock so the default-date path is deterministic and
+        # can't race across midnight
+        with patch('src.news_fetcher.datetime') as mock_dt:
+            mock_dt.now.return_value = datetime(2025, 11, 3)
+
+            fetcher = NewsFetcher(api_key="test-key")
+            result = fetcher.fetch_local_news("Paris", "France")
 
         # Should use current date
         assert 'date' in result
-        assert result['date'] == datetime.now().strftime("%Y-%m-%d")
+        assert result['date'] == "2025-11-03"
 
+    @pytest.mark.parametrize("status,payload,exc", [
+        (401, None, None),  # Unauthorized
+        (200, {"articles": []}, None),
+        (None, None, Exception("Connection error")),
+    ], ids=["api_error", "empty_results", "request_exception"])
     @patch('src.news_fetcher.requests.get')
-    def test_fetch_local_news_api_error(self, mock_get):
-        """Test news fetching with API error falls back to fictional news."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401  # Unauthorized
-        mock_get.return_value = mock_response
+    def test_fetch_local_news_fallback(self, mock_get, status, payload, exc):
+        """Test that every failed fetch falls back to fictional news."""
+        if exc is not None:
+            mock_get.side_effect = exc
+        else:
+            mock_get.return_value = _FakeResp(status, payload)
 
         fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news("Melbourne", "Australia")
+        result = _fetch_melbourne(fetcher)
 
-        # Should fall back to fictional news
-        assert result['source'] == "Fictional (NEWSAPI_KEY not configured)" or "Fictional" in result['source']
-        assert len(result['headlines']) > 0
+        assert "Fictional" in result['source']
+        assert result['headlines']
 
-    @patch.dict('os.environ', {'NEWSAPI_KEY': ''})
-    def test_fetch_local_news_no_api_key(self):
+    def test_fetch_local_news_no_api_key(self, monkeypatch):
         """Test news fetching without API key returns fictional news."""
+        monkeypatch.setenv('NEWSAPI_KEY', '')
         fetcher = NewsFetcher(api_key=None)
-        result = fetcher.fetch_local_news("Melbourne", "Australia", "2025-11-03")
+        result = _fetch_melbourne(fetcher, "2025-11-03")
 
         # Should use fictional news
         assert result['source'] == "Fictional (NEWSAPI_KEY not configured)"
-        assert len(result['headlines']) > 0
+        assert result['headlines']
         assert result['location'] == "Melbourne, Australia"
 
-    @patch('src.news_fetcher.requests.get')
-    def test_fetch_local_news_empty_results(self, mock_get):
-        """Test news fetching with empty results falls back to fictional news."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"articles": []}
-        mock_get.return_value = mock_response
+    @patch('src.news_fetcher.GNews')
+    def test_fetch_local_news_cache_hit(self, mock_gnews_class):
+        """Test that a repeat lookup is served from the in-memory cache."""
+        mock_gnews_instance = Mock(spec=["get_news"])
+        mock_gnews_class.return_value = mock_gnews_instance
+        mock_gnews_instance.get_news.return_value = _GNEWS_MELBOURNE_ARTICLES
 
         fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news("Melbourne", "Australia")
+        fetcher._disk_cache = None  # isolate the in-memory layer
 
-        # Should fall back to fictional news
-        assert len(result['headlines']) > 0
+        first = _fetch_melbourne(fetcher, "2025-11-03")
+        second = _fetch_melbourne(fetcher, "2025-11-03")
 
-    @patch('src.news_fetcher.requests.get')
-    def test_fetch_local_news_request_exception(self, mock_get):
-        """Test news fetching with request exception falls back to fictional news."""
-        mock_get.side_effect = Exception("Connection error")
+        assert mock_gnews_instance.get_news.call_count == 1
+        assert second == first
+
+    @patch('src.news_fetcher.GNews')
+    def test_fetch_local_news_cache_hits_city_alias(self, mock_gnews_class):
+        """Test that aliased city names share a cache entry."""
+        mock_gnews_instance = Mock(spec=["get_news"])
+        mock_gnews_class.return_value = mock_gnews_instance
+        mock_gnews_instance.get_news.return_value = [
+            {
+                "title": "NYC subway delays continue into the weekend",
+                "description": "Commuters face disruptions",
+                "url": "https://news.example.com/nyc-subway",
+                "publisher": {"title": "City News"}
+            }
+        ]
 
         fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news("Melbourne", "Australia")
+        first = fetcher.fetch_local_news("NYC", "USA", "2025-11-03")
+
+        # Second lookup under the canonical name should hit the cache
+        # without another Google News call
+        mock_gnews_instance.get_news.return_value = []
+        second = fetcher.fetch_local_news("New York", "USA", "2025-11-03")
 
-        # Should fall back to fictional news
-        assert len(result['headlines']) > 0
+        assert second == first
+        assert second['source'] == "Google News"
 
-    def test_get_news_summary_with_headlines(self):
+    def test_get_news_summary_with_headlines(self, fetcher):
         """Test news summary generation with headlines."""
         news_data = {
             'headlines': [
@@ -142,85 +291,44 @@ class TestNewsFetcher:
             ]
         }
 
-        fetcher = NewsFetcher(api_key="test-key")
         summary = fetcher.get_news_summary(news_data)
 
         assert "1. Headline 1" in summary
         assert "2. Headline 2" in summary
         assert "3. Headline 3" in summary
 
-    def test_get_news_summary_empty(self):
+    def test_get_news_summary_empty(self, fetcher):
         """Test news summary with no headlines."""
         news_data = {'headlines': []}
 
-        fetcher = NewsFetcher(api_key="test-key")
         summary = fetcher.get_news_summary(news_data)
 
         assert summary == "No news available"
 
-    def test_get_news_summary_no_headlines_key(self):
+    def test_get_news_summary_no_headlines_key(self, fetcher):
         """Test news summary with missing headlines key."""
         news_data = {}
 
-        fetcher = NewsFetcher(api_key="test-key")
         summary = fetcher.get_news_summary(news_data)
 
         assert summary == "No news available"
 
-    def test_select_dominant_topic_from_data(self):
-        """Test selecting dominant topic from news data."""
-        news_data = {
-            'dominant_topic': 'Local Politics',
-            'headlines': [
-                {'title': 'Political News', 'summary': 'Summary'}
-            ]
-        }
-
-        fetcher = NewsFetcher(api_key="test-key")
-        topic = fetcher.select_dominant_topic(news_data)
-
-        assert topic == 'Local Politics'
-
-    def test_select_dominant_topic_fallback_to_headline(self):
-        """Test selecting dominant topic falls back to first headline."""
-        news_data = {
-            'headlines': [
-                {'title': 'First Headline', 'summary': 'Summary'}
-            ]
-        }
-
-        fetcher = NewsFetcher(api_key="test-key")
-        topic = fetcher.select_dominant_topic(news_data)
-
-        assert topic == 'First Headline'
-
-    def test_select_dominant_topic_default(self):
-        """Test selecting dominant topic with no data."""
-        news_data = {}
-
-        fetcher = NewsFetcher(api_key="test-key")
-        topic = fetcher.select_dominant_topic(news_data)
-
-        assert topic == 'General News'
-
-    def test_select_dominant_topic_ignores_error_state(self):
-        """Test selecting dominant topic ignores error state."""
-        news_data = {
-            'dominant_topic': 'Error',
-            'headlines': [
-                {'title': 'Real Headline', 'summary': 'Summary'}
-            ]
-        }
-
-        fetcher = NewsFetcher(api_key="test-key")
-        topic = fetcher.select_dominant_topic(news_data)
-
-        assert topic == 'Real Headline'
-
-    @patch.object(NewsFetcher, 'fetch_local_news')
-    @patch.object(NewsFetcher, 'select_dominant_topic')
-    @patch.object(NewsFetcher, 'get_news_summary')
-    def test_fetch_and_summarize(self, mock_summary, mock_topic, mock_fetch):
+    @pytest.mark.parametrize("news_data,expected", [
+        ({'dominant_topic': 'Local Politics',
+          'headlines': [{'title': 'Political News', 'summary': 'Summary'}]},
+         'Local Politics'),
+        ({'headlines': [{'title': 'First Headline', 'summary': 'Summary'}]},
+         'First Headline'),
+        ({}, 'General News'),
+        ({'dominant_topic': 'Error',
+          'headlines': [{'title': 'Real Headline', 'summary': 'Summary'}]},
+         'Real Headline'),
+    ], ids=["from_data", "fallback_to_headline", "default", "ignores_error_state"])
+    def test_select_dominant_topic(self, fetcher, news_data, expected):
+        """Test topic selection from data, fallback, default and error states."""
+        assert fetcher.select_dominant_topic(news_data) == expected
+
+    def test_fetch_and_summarize(self, fetcher, monkeypatch):
         """Test fetch_and_summarize combines all data."""
         news_data = {
             'location': 'Melbourne, Australia',
@@ -228,11 +336,18 @@ class TestNewsFetcher:
             'headlines': []
         }
 
-        mock_fetch.return_value = news_data
-        mock_topic.return_value = 'Local News'
-        mock_summary.return_value = 'News summary'
+        # Only return values are asserted here, so plain lambdas via
+        # monkeypatch's setattr/undo stack beat building three mocks
+        monkeypatch.setattr(
+            NewsFetcher, 'fetch_local_news', lambda self, *a, **kw: news_data
+        )
+        monkeypatch.setattr(
+            NewsFetcher, 'select_dominant_topic', lambda self, data: 'Local News'
+        )
+        monkeypatch.setattr(
+            NewsFetcher, 'get_news_summary', lambda self, data: 'News summary'
+        )
 
-        fetcher = NewsFetcher(api_key="test-key")
         result = fetcher.fetch_and_summarize("Melbourne", "Australia", "2025-11-03")
 
         assert result['news_data'] == news_data
@@ -242,141 +357,95 @@ class TestNewsFetcher:
         assert result['date'] == '2025-11-03'
 
     @patch.object(NewsFetcher, 'fetch_local_news')
-    def test_fetch_and_summarize_without_date(self, mock_fetch):
+    def test_fetch_and_summarize_without_date(self, mock_fetch, fetcher):
         """Test fetch_and_summarize without explicit date."""
         news_data = {
             'location': 'Tokyo, Japan',
-            'date': datetime.now().strftime("%Y-%m-%d"),
+            'date': '2025-11-03',
             'headlines': []
         }
 
         mock_fetch.return_value = news_data
 
-        fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_and_summarize("Tokyo", "Japan")
+        # fetch_and_summarize stamps today's date itself when none is given
+        with patch('src.news_fetcher.datetime') as mock_dt:
+            mock_dt.now.return_value = datetime(2025, 11, 3)
+            result = fetcher.fetch_and_summarize("Tokyo", "Japan")
+
+        assert result['date'] == '2025-11-03'
+
+    @patch.object(NewsFetcher, 'fetch_and_summarize')
+    def test_fetch_many_preserves_order(self, mock_fetch, fetcher):
+        """Test fetch_many returns results in the same order as locations."""
+        mock_fetch.side_effect = lambda city, country, date=None: {
+            'location': f"{city}, {country}"
+        }
+
+        results = fetcher.fetch_many([
+            ("Melbourne", "Australia"),
+            ("Paris", "France"),
+            ("Tokyo", "Japan")
+        ])
 
-        assert result['date'] == datetime.now().strftime("%Y-%m-%d")
+        assert [r['location'] for r in results] == [
+            "Melbourne, Australia",
+            "Paris, France",
+            "Tokyo, Japan"
+        ]
+        assert mock_fetch.call_count == 3
+
+    def test_fetch_many_empty_locations(self, fetcher):
+        """Test fetch_many with no locations returns an empty list."""
+        assert fetcher.fetch_many([]) == []
 
 
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
-    @patch('src.news_fetcher.NewsFetcher.fetch_and_summarize')
-    def test_fetch_news_for_location(self, mock_fetch_and_summarize):
-        """Test fetch_news_for_location convenience function."""
-        expected_result = {
-            'news_data': {},
-            'dominant_topic': 'Test Topic',
-            'summary': 'Test summary',
-            'location': 'Test City, Test Country',
-            'date': '2025-11-03'
-        }
-        mock_fetch_and_summarize.return_value = expected_result
-
-        result = fetch_news_for_location(
-            "Test City",
-            "Test Country",
-            "2025-11-03",
-            "test-api-key"
+    @pytest.fixture
+    def summarize_mock(self, monkeypatch):
+        """fetch_and_summarize patched to return the canonical payload."""
+        mock = Mock(return_value=dict(_FETCH_NEWS_RESULT))
+        monkeypatch.setattr(
+            'src.news_fetcher.NewsFetcher.fetch_and_summarize', mock
         )
-
+        return mock
+
+    @pytest.mark.parametrize("call_kwargs", [
+        {"date": "2025-11-03", "api_key": "test-api-key"},
+        {},
+        {"sort_by": "popularity"},
+    ], ids=["full_args", "without_date", "with_sort_by"])
+    def test_fetch_news_for_location(self, summarize_mock, call_kwargs):
+        """Test fetch_news_for_location across its argument combinations."""
+        result = fetch_news_for_location("Test City", "Test Country", **call_kwargs)
+
+        summarize_mock.assert_called_once()
         assert result['dominant_topic'] == 'Test Topic'
         assert result['location'] == 'Test City, Test Country'
-
-    @patch('src.news_fetcher.NewsFetcher.fetch_and_summarize')
-    def test_fetch_news_for_location_without_date(self, mock_fetch_and_summarize):
-        """Test fetch_news_for_location without date."""
-        expected_result = {
-            'news_data': {},
-            'dominant_topic': 'Test Topic',
-            'summary': 'Test summary',
-            'location': 'Test City, Test Country',
-            'date': datetime.now().strftime("%Y-%m-%d")
-        }
-        mock_fetch_and_summarize.return_value = expected_result
-
-        result = fetch_news_for_location("Test City", "Test Country")
-
         assert 'date' in result
-        assert result['dominant_topic'] == 'Test Topic'
+        assert result['sort_by'] == 'popularity'
 
+    @pytest.mark.parametrize("sort_in,sort_out", [
+        ("popularity", "popularity"),
+        ("publishedAt", "publishedAt"),
+        # Unknown values fall back to popularity
+        ("invalid_sort", "popularity"),
+    ])
     @patch('src.news_fetcher.requests.get')
-    def test_fetch_local_news_with_sort_by_popularity(self, mock_get):
-        """Test news fetching with sort_by='popularity' parameter."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "articles": [
-                {
-                    "title": "Melbourne trending story",
-                    "description": "Trending news in Melbourne"
-                },
-                {
-                    "title": "Melbourne recent story",
-                    "description": "Recent news in Melbourne"
-                }
-            ]
-        }
-        mock_get.return_value = mock_response
+    def test_fetch_local_news_sort_by(self, mock_get, sort_in, sort_out):
+        """Test that each sort_by value maps to the expected sortBy parameter."""
+        mock_get.return_value = _FakeResp(200, {"articles": _SUCCESS_ARTICLES})
 
         fetcher = NewsFetcher(api_key="test-key")
         result = fetcher.fetch_local_news(
-            "Melbourne", "Australia", sort_by="popularity"
+            "Melbourne", "Australia", sort_by=sort_in
         )
 
-        # Verify the API was called with popularity sorting
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['sortBy'] == 'popularity'
+        params = mock_get.call_args.kwargs['params']
+        assert params['sortBy'] == sort_out
         assert result['location'] == "Melbourne, Australia"
 
-    @patch('src.news_fetcher.requests.get')
-    def test_fetch_local_news_with_sort_by_publishedAt(self, mock_get):
-        """Test news fetching with sort_by='publishedAt' parameter."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "articles": [
-                {
-                    "title": "Melbourne latest",
-                    "description": "Latest news in Melbourne"
-                }
-            ]
-        }
-        mock_get.return_value = mock_response
-
-        fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news(
-            "Melbourne", "Australia", sort_by="publishedAt"
-        )
-
-        # Verify the API was called with publishedAt sorting
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['sortBy'] == 'publishedAt'
-
-    @patch('src.news_fetcher.requests.get')
-    def test_fetch_local_news_with_invalid_sort_by(self, mock_get):
-        """Test news fetching with invalid sort_by falls back to popularity."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "articles": [
-                {
-                    "title": "Melbourne news",
-                    "description": "News in Melbourne"
-                }
-            ]
-        }
-        mock_get.return_value = mock_response
-
-        fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news(
-            "Melbourne", "Australia", sort_by="invalid_sort"
-        )
-
-        # Should fall back to popularity
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['sortBy'] == 'popularity'
-
     @patch.object(NewsFetcher, 'fetch_local_news')
     def test_fetch_and_summarize_with_sort_by(self, mock_fetch):
         """Test fetch_and_summarize passes sort_by parameter."""
@@ -398,31 +467,23 @@ class TestConvenienceFunctions:
         )
         assert result['sort_by'] == 'popularity'
 
-    @patch('src.news_fetcher.NewsFetcher.fetch_and_summarize')
-    def test_fetch_news_for_location_with_sort_by(self, mock_fetch_and_summarize):
-        """Test fetch_news_for_location passes sort_by parameter."""
-        expected_result = {
-            'news_data': {},
-            'dominant_topic': 'Test Topic',
-            'summary': 'Test summary',
-            'location': 'Test City, Test Country',
-            'date': datetime.now().strftime("%Y-%m-%d"),
-            'sort_by': 'popularity'
-        }
-        mock_fetch_and_summarize.return_value = expected_result
-
-        result = fetch_news_for_location(
-            "Test City", "Test Country", sort_by="popularity"
-        )
-
-        assert result['sort_by'] == 'popularity'
-
 
 class TestNewsStoriesRetrieval:
     """Tests demonstrating news stories being retrieved."""
 
-    @patch('src.news_fetcher.GNews')
-    def test_news_stories_retrieved_with_details(self, mock_gnews_class):
+    @pytest.fixture(autouse=True)
+    def patch_gnews(self, monkeypatch):
+        """Install one mocked GNews client for every test in the class.
+
+        monkeypatch's plain setattr replaces the per-test @patch decorator
+        stack, so each test just stubs self.mock_gnews.get_news.
+        """
+        self.mock_gnews = Mock(spec=["get_news"])
+        monkeypatch.setattr(
+            'src.news_fetcher.GNews', Mock(return_value=self.mock_gnews)
+        )
+
+    def test_news_stories_retrieved_with_details(self):
         """Test that news stories are retrieved with complete details.
 
         This test demonstrates:
@@ -430,46 +491,11 @@ class TestNewsStoriesRetrieval:
         - Stories are filtered by location
         - Complete story details are preserved (title, summary, URL, source)
         """
-        # Mock GNews client
-        mock_gnews_instance = MagicMock()
-        mock_gnews_class.return_value = mock_gnews_instance
-
-        # Mock multiple news articles in Google News format
-        mock_gnews_instance.get_news.return_value = [
-            {
-                "title": "Melbourne heatwave causes traffic chaos on main roads",
-                "description": "Extreme temperatures in Melbourne caused significant traffic disruptions today",
-                "url": "https://news.example.com/melbourne-heat-1",
-                "publisher": {"title": "News Today"}
-            },
-            {
-                "title": "Melbourne startup raises funding milestone",
-                "description": "A Melbourne-based tech company announced record funding round",
-                "url": "https://news.example.com/melbourne-startup",
-                "publisher": {"title": "Tech News"}
-            },
-            {
-                "title": "Melbourne arts festival announces 2025 program",
-                "description": "The annual Melbourne arts festival has revealed its diverse lineup",
-                "url": "https://news.example.com/melbourne-arts",
-                "publisher": {"title": "Arts Weekly"}
-            },
-            {
-                "title": "New bike lanes open in Melbourne CBD",
-                "description": "City council completed expansion of bicycle infrastructure in Melbourne",
-                "url": "https://news.example.com/melbourne-bikes",
-                "publisher": {"title": "City News"}
-            },
-            {
-                "title": "Melbourne weather: Summer forecast looks intense",
-                "description": "Meteorologists predict Melbourne will experience hot and dry summer conditions",
-                "url": "https://news.example.com/melbourne-weather",
-                "publisher": {"title": "Weather Hub"}
-            }
-        ]
+        # Multiple news articles in Google News format
+        self.mock_gnews.get_news.return_value = _GNEWS_MELBOURNE_ARTICLES
 
         fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news("Melbourne", "Australia", num_headlines=5)
+        result = _fetch_melbourne(fetcher, num_headlines=5)
 
         # Verify stories were retrieved
         assert result is not None
@@ -501,8 +527,7 @@ class TestNewsStoriesRetrieval:
         assert result['location'] == "Melbourne, Australia"
         assert result['source'] == "Google News"
 
-    @patch('src.news_fetcher.GNews')
-    def test_news_stories_filtered_by_location(self, mock_gnews_class):
+    def test_news_stories_filtered_by_location(self):
         """Test that news stories are properly filtered by location.
 
         Demonstrates:
@@ -510,39 +535,10 @@ class TestNewsStoriesRetrieval:
         - Non-location stories are filtered out
         - Location matching prioritizes title over description
         """
-        # Mock GNews client
-        mock_gnews_instance = MagicMock()
-        mock_gnews_class.return_value = mock_gnews_instance
-
-        mock_gnews_instance.get_news.return_value = [
-            {
-                "title": "Tokyo launches new subway line",  # Not Melbourne
-                "description": "Japanese capital opens transportation",
-                "url": "https://news.example.com/tokyo-1",
-                "publisher": {"title": "News"}
-            },
-            {
-                "title": "Melbourne weather update",  # Melbourne in title
-                "description": "Local conditions report",
-                "url": "https://news.example.com/melbourne-weather",
-                "publisher": {"title": "News"}
-            },
-            {
-                "title": "Technology trends",  # Generic title
-                "description": "New developments in Melbourne technology sector",  # Melbourne in description
-                "url": "https://news.example.com/tech-1",
-                "publisher": {"title": "News"}
-            },
-            {
-                "title": "Melbourne's famous landmarks attract tourists",  # Melbourne in title
-                "description": "Popular destinations worldwide",
-                "url": "https://news.example.com/landmarks",
-                "publisher": {"title": "News"}
-            }
-        ]
+        self.mock_gnews.get_news.return_value = _GNEWS_MIXED_LOCATION_ARTICLES
 
         fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news("Melbourne", "Australia", num_headlines=5)
+        result = _fetch_melbourne(fetcher, num_headlines=5)
 
         headlines = result['headlines']
 
@@ -557,20 +553,19 @@ class TestNewsStoriesRetrieval:
         assert not any("Tokyo" in title for title in titles), \
             "Tokyo story should have been filtered out"
 
-    @patch('src.news_fetcher.GNews')
-    def test_news_stories_with_sorting_method(self, mock_gnews_class):
-        """Test that news stories are retrieved with default sorting.
+    @pytest.mark.parametrize("fetch_kwargs", [
+        {},  # Google News sorts by relevance, no explicit parameter
+        {"sort_by": "publishedAt"},  # deprecated, kept for backwards compat
+    ], ids=["default", "deprecated_sort_by"])
+    def test_news_stories_with_sorting_method(self, fetch_kwargs):
+        """Test that news stories are retrieved with and without sort_by.
 
         Demonstrates:
         - Google News provides relevance-based sorting (no explicit parameter)
         - Stories can still be retrieved with sorting parameter (kept for backwards compatibility)
         - Stories are returned in relevance order
         """
-        # Mock GNews client
-        mock_gnews_instance = MagicMock()
-        mock_gnews_class.return_value = mock_gnews_instance
-
-        mock_gnews_instance.get_news.return_value = [
+        self.mock_gnews.get_news.return_value = [
             {
                 "title": "Trending story in Melbourne",
                 "description": "This is a viral story",
@@ -587,16 +582,11 @@ class TestNewsStoriesRetrieval:
 
         fetcher = NewsFetcher(api_key="test-key")
 
-        # Test default (Google News uses relevance by default)
-        result = fetcher.fetch_local_news("Melbourne", "Australia")
-        assert len(result['headlines']) > 0, "Should retrieve stories"
+        result = _fetch_melbourne(fetcher, **fetch_kwargs)
 
-        # Test with explicit sorting (deprecated but still works)
-        result = fetcher.fetch_local_news("Melbourne", "Australia", sort_by="publishedAt")
-        assert len(result['headlines']) > 0, "Should retrieve stories even with deprecated sort_by"
+        assert result['headlines'], "Should retrieve stories"
 
-    @patch('src.news_fetcher.GNews')
-    def test_news_stories_summary_generation(self, mock_gnews_class):
+    def test_news_stories_summary_generation(self):
         """Test that news story summaries are properly generated.
 
         Demonstrates:
@@ -604,11 +594,7 @@ class TestNewsStoriesRetrieval:
         - Summaries are limited in length
         - Summary truncation works correctly
         """
-        # Mock GNews client
-        mock_gnews_instance = MagicMock()
-        mock_gnews_class.return_value = mock_gnews_instance
-
-        mock_gnews_instance.get_news.return_value = [
+        self.mock_gnews.get_news.return_value = [
             {
                 "title": "Melbourne traffic reaches record levels",
                 "description": "A very long description about traffic conditions in Melbourne that goes on and on with lots of details about the causes and effects of traffic congestion on roads throughout the city and surrounding suburbs",
@@ -624,7 +610,7 @@ class TestNewsStoriesRetrieval:
         ]
 
         fetcher = NewsFetcher(api_key="test-key")
-        result = fetcher.fetch_local_news("Melbourne", "Australia", num_headlines=2)
+        result = _fetch_melbourne(fetcher, num_headlines=2)
 
         headlines = result['headlines']
         assert len(headlines) == 2
@@ -632,11 +618,11 @@ class TestNewsStoriesRetrieval:
         # Verify summaries exist and are properly formatted
         for headline in headlines:
             assert 'summary' in headline
-            assert len(headline['summary']) > 0
+            assert headline['summary']
             # Summaries should be capped at ~150 chars (based on code)
             assert len(headline['summary']) <= 160
 
-    def test_news_stories_display_format(self):
+    def test_news_stories_display_format(self, fetcher):
         """Test that retrieved news stories can be displayed properly.
 
         Demonstrates the format of news data after retrieval:
@@ -678,15 +664,12 @@ class TestNewsStoriesRetrieval:
         assert len(news_data['headlines']) == 3
         assert news_data['source'] == "NewsAPI"
 
-        # Verify each headline can be displayed
+        # Verify each headline can be displayed: one compiled validator
+        # traversal per headline instead of per-field asserts
         for headline in news_data['headlines']:
-            assert headline['title']
-            assert headline['summary']
-            assert headline['url']
-            assert headline['source']
+            _HEADLINE_VALIDATOR.validate(headline)
 
         # Verify summary text generation
-        fetcher = NewsFetcher(api_key="test-key")
         summary = fetcher.get_news_summary(news_data)
 
         assert "1. Melbourne startup wins innovation award" in summary
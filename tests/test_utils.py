@@ -57,7 +57,8 @@ class TestSaveCartoonData:
         }
 
         with patch('src.utils.Path.mkdir'), \
-             patch('builtins.open', MagicMock()):
+             patch('builtins.open', MagicMock()), \
+             patch('src.utils.os.replace'):
             save_cartoon_data("Melbourne", cartoon_data)
 
             # Verify metadata was added
@@ -16,41 +16,35 @@ def check_python_version():
 
 
 def check_required_packages():
-    """Verify all required packages are installed."""
+    """Verify all required packages are installed.
+
+    Reads installed-package metadata instead of importing each package:
+    importing timezonefinder loads its polygon dataset and
+    google.generativeai pulls in the gRPC stack, which together dominate
+    this script's runtime for no verification benefit.
+    """
+    from importlib.metadata import version, PackageNotFoundError
+
+    # import name -> distribution name (as known to pip)
     required = {
-        'streamlit': '1.32.0',
-        'streamlit_js_eval': '0.1.5',
-        'google.generativeai': '0.5.0',
-        'geopy': '2.4.1',
-        'geocoder': '1.38.1',
-        'dotenv': '1.0.0',
-        'pytz': '2024.1',
-        'PIL': '10.3.0',
-        'timezonefinder': '6.2.0',
-        'requests': '2.31.0',
+        'streamlit': 'streamlit',
+        'streamlit_js_eval': 'streamlit-js-eval',
+        'google.generativeai': 'google-generativeai',
+        'geopy': 'geopy',
+        'geocoder': 'geocoder',
+        'dotenv': 'python-dotenv',
+        'PIL': 'pillow',
+        'timezonefinder': 'timezonefinder',
+        'requests': 'requests',
     }
 
     missing = []
-    outdated = []
 
-    for package, min_version in required.items():
+    for package, dist_name in required.items():
         try:
-            if package == 'dotenv':
-                import dotenv
-                pkg = dotenv
-            elif package == 'PIL':
-                import PIL
-                pkg = PIL
-            elif package == 'google.generativeai':
-                import google.generativeai
-                pkg = google.generativeai
-            else:
-                pkg = __import__(package)
-
-            version = getattr(pkg, '__version__', 'unknown')
-            print(f"✅ {package} ({version})")
-
-        except ImportError:
+            installed = version(dist_name)
+            print(f"✅ {package} ({installed})")
+        except PackageNotFoundError:
             print(f"❌ {package} - NOT INSTALLED")
             missing.append(package)
 